@@ -4,13 +4,18 @@ import numpy as np
 import json  # Para lidar com as entradas de listas
 
 # Importa todas as funções dos módulos
-from metodos.utils import criar_funcao
-from metodos.fechados import isolamento_raiz, metodo_bisseccao, metodo_posicao_falsa
-from metodos.abertos import metodo_newton_raphson, metodo_secante, metodo_ponto_fixo
+from metodos.utils import criar_funcao, formatar_iteracoes
+from metodos.fechados import isolamento_raiz, metodo_bisseccao, metodo_posicao_falsa, metodo_brent
+from metodos.abertos import metodo_newton_raphson, metodo_secante, metodo_ponto_fixo, metodo_ponto_fixo_acelerado
 from metodos.lineares import metodo_eliminacao_gauss
-from metodos.interpolacao import interpolacao_lagrange, interpolacao_newton_diferencas_divididas
-from metodos.ajuste_curvas import ajuste_minimos_quadrados
-from metodos.integracao import regra_trapezio, regra_simpson_1_3
+from metodos.lineares_iterativos import metodo_gauss_jacobi, metodo_gauss_seidel, metodo_sor
+from metodos.interpolacao import (interpolacao_lagrange, interpolacao_newton_diferencas_divididas,
+                                  interpolacao_inversa, interpolacao_spline_cubico)
+from metodos.ajuste_curvas import ajuste_minimos_quadrados, ajuste_minimos_quadrados_fluxo
+from metodos.integracao import (
+    regra_trapezio, regra_simpson_1_3, regra_simpson_3_8, regra_boole,
+    integracao_simpson_adaptativa, integracao_romberg, regra_gauss_legendre
+)
 
 
 # =========================================================================
@@ -43,21 +48,22 @@ st.markdown("---")
 METODOS = {
     "Raízes de Equações": [
         "1. Bissecção", "2. Posição Falsa", "3. Newton-Raphson",
-        "4. Secante", "5. Ponto Fixo (Extra)"
+        "4. Secante", "5. Ponto Fixo (Extra)", "15. Brent (Híbrido)"
     ],
     "Sistemas Lineares": [
-        "6. Eliminação de Gauss",
-        # "7. Gauss-Jacobi (A ser implementado)",
-        # "8. Gauss-Seidel (A ser implementado)"
+        "6. Eliminação de Gauss", "7. Gauss-Jacobi", "8. Gauss-Seidel", "16. SOR (Sobre-relaxação)"
     ],
     "Interpolação": [
-        "9. Lagrange", "10. Diferenças Divididas (Newton)"
+        "9. Lagrange", "10. Diferenças Divididas (Newton)", "17. Interpolação Inversa",
+        "18. Spline Cúbico (Natural)"
     ],
     "Ajuste de Curvas": [
-        "11. Mínimos Quadrados (Reta)", "12. Mínimos Quadrados (Parábola)"
+        "11. Mínimos Quadrados (Reta)", "12. Mínimos Quadrados (Parábola)",
+        "19. Mínimos Quadrados (Grau n)"
     ],
     "Integração Numérica": [
-        "13. Regra do Trapézio", "14. 1/3 de Simpson"
+        "13. Regra do Trapézio", "14. 1/3 de Simpson", "20. 3/8 de Simpson", "21. Regra de Boole",
+        "22. Simpson Adaptativo", "23. Romberg", "24. Gauss-Legendre"
     ]
 }
 
@@ -93,7 +99,7 @@ if grupo_selecionado in ["Raízes de Equações", "Integração Numérica"]:
 
 # --- 1. RAÍZES DE EQUAÇÕES (Fechados) ---
 
-if metodo_selecionado in ["1. Bissecção", "2. Posição Falsa"]:
+if metodo_selecionado in ["1. Bissecção", "2. Posição Falsa", "15. Brent (Híbrido)"]:
 
     st.subheader("Configuração do Intervalo")
     col_pi, col_pf = st.columns(2)
@@ -112,14 +118,19 @@ if metodo_selecionado in ["1. Bissecção", "2. Posição Falsa"]:
             st.success(f"Raiz isolada no intervalo: **[{a_isolado:.6f}, {b_isolado:.6f}]**")
 
             try:
+                avaliacoes = None
                 if metodo_selecionado == "1. Bissecção":
-                    raiz, iteracoes = metodo_bisseccao(f_num, a_isolado, b_isolado, tol)
-                else:
-                    raiz, iteracoes = metodo_posicao_falsa(f_num, a_isolado, b_isolado, tol)
+                    raiz, iteracoes = metodo_bisseccao(f_num, a_isolado, b_isolado, tol, rastreio="array")
+                elif metodo_selecionado == "2. Posição Falsa":
+                    raiz, iteracoes = metodo_posicao_falsa(f_num, a_isolado, b_isolado, tol, rastreio="array")
+                else:  # Brent
+                    raiz, iteracoes, avaliacoes = metodo_brent(f_num, a_isolado, b_isolado, tol, rastreio="array")
 
                 st.subheader("Resultados")
                 st.success(f"**Raiz Aproximada:** `{raiz:.6f}` em {len(iteracoes)} iterações.")
-                st.dataframe(pd.DataFrame(iteracoes))
+                if avaliacoes is not None:
+                    st.info(f"Avaliações de f(x): {avaliacoes}")
+                st.dataframe(pd.DataFrame(formatar_iteracoes(iteracoes)))  # Formata só na exibição
 
             except Exception as e:
                 st.error(f"Erro durante o cálculo: {e}")
@@ -132,11 +143,11 @@ elif metodo_selecionado == "3. Newton-Raphson":
 
     if st.button("Executar Newton-Raphson"):
         try:
-            raiz, iteracoes = metodo_newton_raphson(func_str, x0, tol)
+            raiz, iteracoes = metodo_newton_raphson(func_str, x0, tol, rastreio="array")
 
             st.subheader("Resultados")
             st.success(f"**Raiz Aproximada:** `{raiz:.6f}` em {len(iteracoes)} iterações.")
-            st.dataframe(pd.DataFrame(iteracoes))
+            st.dataframe(pd.DataFrame(formatar_iteracoes(iteracoes)))  # Formata só na exibição
 
         except Exception as e:
             st.error(f"Erro durante o cálculo de Newton-Raphson: {e}")
@@ -153,11 +164,11 @@ elif metodo_selecionado == "4. Secante":
 
     if st.button("Executar Secante"):
         try:
-            raiz, iteracoes = metodo_secante(f_num, x_ant, x_i, tol)
+            raiz, iteracoes = metodo_secante(f_num, x_ant, x_i, tol, rastreio="array")
 
             st.subheader("Resultados")
             st.success(f"**Raiz Aproximada:** `{raiz:.6f}` em {len(iteracoes)} iterações.")
-            st.dataframe(pd.DataFrame(iteracoes))
+            st.dataframe(pd.DataFrame(formatar_iteracoes(iteracoes)))  # Formata só na exibição
 
         except Exception as e:
             st.error(f"Erro durante o cálculo da Secante: {e}")
@@ -172,13 +183,23 @@ elif metodo_selecionado == "5. Ponto Fixo (Extra)":
     with col_x0:
         x0 = st.number_input("Chute Inicial (x0)", value=0.5, step=0.1, key="x0_pf")
 
+    aceleracao = st.selectbox("Aceleração", ["Nenhuma", "Steffensen", "Aitken"], key="acel_pf")
+
     if st.button("Executar Ponto Fixo"):
         try:
-            raiz, iteracoes = metodo_ponto_fixo(g_str, x0, tol)
+            relatorio = None
+            if aceleracao == "Nenhuma":
+                raiz, iteracoes = metodo_ponto_fixo(g_str, x0, tol, rastreio="array")
+            else:
+                raiz, iteracoes, relatorio = metodo_ponto_fixo_acelerado(
+                    g_str, x0, tol, metodo=aceleracao.lower(), rastreio="array")
 
             st.subheader("Resultados")
             st.success(f"**Raiz Aproximada:** `{raiz:.6f}` em {len(iteracoes)} iterações.")
-            st.dataframe(pd.DataFrame(iteracoes))
+            if relatorio is not None and relatorio['iteracoes_sem_aceleracao_estimadas'] is not None:
+                st.info(f"Avaliações de g(x): {relatorio['avaliacoes_g']} "
+                        f"(sem aceleração, estimadas: {relatorio['iteracoes_sem_aceleracao_estimadas']})")
+            st.dataframe(pd.DataFrame(formatar_iteracoes(iteracoes)))  # Formata só na exibição
 
         except Exception as e:
             st.error(f"Erro durante o cálculo de Ponto Fixo: {e}")
@@ -210,8 +231,52 @@ elif metodo_selecionado == "6. Eliminação de Gauss":
             st.error(f"Erro durante o cálculo de Gauss: {e}")
 
 
+# --- 5.1 SISTEMAS LINEARES (Métodos Iterativos) ---
+elif metodo_selecionado in ["7. Gauss-Jacobi", "8. Gauss-Seidel", "16. SOR (Sobre-relaxação)"]:
+    st.warning("Insira as matrizes como strings de listas JSON (Ex: [[4, 1], [1, 3]])")
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        A_str = st.text_area("Matriz A (Ex: [[4, 1], [1, 3]])", value="[[4.0, 1.0], [1.0, 3.0]]")
+    with col_b:
+        b_str = st.text_input("Vetor b (Ex: [1, 2])", value="[1.0, 2.0]")
+
+    col_tol, col_iter, col_omega = st.columns(3)
+    with col_tol:
+        tol = st.number_input("Tolerância do resíduo (tol)", value=0.0001, format="%.6f", step=0.00001)
+    with col_iter:
+        max_iter = st.number_input("Máximo de iterações", value=500, min_value=1, step=10)
+    with col_omega:
+        omega = st.number_input("Fator de relaxação (omega, só SOR)", value=1.5, min_value=0.01,
+                                max_value=1.99, step=0.05)
+
+    if st.button(f"Executar {metodo_selecionado}"):
+        A = parse_input_list(A_str, None)
+        b = parse_input_list(b_str, None)
+
+        try:
+            if metodo_selecionado == "7. Gauss-Jacobi":
+                solucao, relatorio = metodo_gauss_jacobi(A, b, tol, max_iter=int(max_iter))
+            elif metodo_selecionado == "8. Gauss-Seidel":
+                solucao, relatorio = metodo_gauss_seidel(A, b, tol, max_iter=int(max_iter))
+            else:
+                solucao, relatorio = metodo_sor(A, b, tol, omega=omega, max_iter=int(max_iter))
+
+            st.subheader("Resultados")
+            if relatorio['convergiu']:
+                st.success(f"Vetor Solução X: `{solucao.round(6)}` em {relatorio['iteracoes']} iterações.")
+            else:
+                st.warning(f"Não convergiu em {relatorio['iteracoes']} iterações. Última aproximação: "
+                           f"`{solucao.round(6)}`")
+            st.info(f"Resíduo relativo ||b - Ax|| / ||b||: {relatorio['residuo']:.3e} | "
+                    f"Tempo: {relatorio['tempo'] * 1000:.2f} ms")
+
+        except Exception as e:
+            st.error(f"Erro durante o cálculo iterativo: {e}")
+
+
 # --- 6. INTERPOLAÇÃO (Lagrange e Newton) ---
-elif metodo_selecionado in ["9. Lagrange", "10. Diferenças Divididas (Newton)"]:
+elif metodo_selecionado in ["9. Lagrange", "10. Diferenças Divididas (Newton)", "18. Spline Cúbico (Natural)"]:
     st.warning("Insira os pontos x e y como strings de listas JSON (Ex: [1, 2, 3])")
 
     col_x, col_y = st.columns(2)
@@ -234,6 +299,9 @@ elif metodo_selecionado in ["9. Lagrange", "10. Diferenças Divididas (Newton)"]
             if metodo_selecionado == "9. Lagrange":
                 resultado = interpolacao_lagrange(x_pontos, y_pontos, x_interpolar)
                 st.success(f"P({x_interpolar}) ≈ `{resultado:.6f}`")
+            elif metodo_selecionado == "18. Spline Cúbico (Natural)":
+                resultado = interpolacao_spline_cubico(x_pontos, y_pontos, x_interpolar)
+                st.success(f"S({x_interpolar}) ≈ `{resultado:.6f}`")
             else:  # Diferenças Divididas (Newton)
                 resultado, tabela = interpolacao_newton_diferencas_divididas(x_pontos, y_pontos, x_interpolar)
                 st.success(f"P({x_interpolar}) ≈ `{resultado:.6f}`")
@@ -244,11 +312,55 @@ elif metodo_selecionado in ["9. Lagrange", "10. Diferenças Divididas (Newton)"]
             st.error(f"Erro na Interpolação: {e}")
 
 
+# --- 6.1 INTERPOLAÇÃO INVERSA ---
+elif metodo_selecionado == "17. Interpolação Inversa":
+    st.warning("Insira os pontos x e y como strings de listas JSON (Ex: [1, 2, 3])")
+
+    col_x, col_y = st.columns(2)
+    with col_x:
+        x_str = st.text_input("Pontos X (Ex: [0, 1, 2])", value="[0.0, 1.0, 2.0]")
+    with col_y:
+        y_str = st.text_input("Pontos Y (Ex: [1, 2.718, 7.389])", value="[1.0, 2.718, 7.389]")
+
+    col_alvo, col_grau = st.columns(2)
+    with col_alvo:
+        y_alvo = st.number_input("Valor de Y alvo:", value=2.0, step=0.1)
+    with col_grau:
+        grau_inv = st.number_input("Grau do polinômio local", value=3, min_value=1, step=1)
+
+    if st.button(f"Executar {metodo_selecionado}"):
+        x_pontos = parse_input_list(x_str, None)
+        y_pontos = parse_input_list(y_str, None)
+
+        if len(x_pontos) != len(y_pontos):
+            st.error("As listas de pontos X e Y devem ter o mesmo número de elementos.")
+            st.stop()
+
+        try:
+            resultado = interpolacao_inversa(x_pontos, y_pontos, y_alvo, grau=int(grau_inv))
+            if np.isnan(resultado):
+                st.warning(f"O valor {y_alvo} está fora do intervalo dos dados Y.")
+            else:
+                st.success(f"x tal que P(x) = {y_alvo}: `{resultado:.6f}`")
+
+        except Exception as e:
+            st.error(f"Erro na Interpolação Inversa: {e}")
+
+
 # --- 7. AJUSTE DE CURVAS (Mínimos Quadrados) ---
-elif metodo_selecionado in ["11. Mínimos Quadrados (Reta)", "12. Mínimos Quadrados (Parábola)"]:
+elif metodo_selecionado in ["11. Mínimos Quadrados (Reta)", "12. Mínimos Quadrados (Parábola)",
+                             "19. Mínimos Quadrados (Grau n)"]:
     st.warning("Insira os pontos x e y como strings de listas JSON (Ex: [1, 2, 3])")
 
-    grau = 1 if "Reta" in metodo_selecionado else 2
+    caminho_dados = ""
+    if "Grau n" in metodo_selecionado:
+        col_grau, col_arquivo = st.columns(2)
+        with col_grau:
+            grau = st.number_input("Grau do polinômio", value=3, min_value=0, step=1)
+        with col_arquivo:
+            caminho_dados = st.text_input("Arquivo de dados (CSV x,y ou .npy, opcional)", value="")
+    else:
+        grau = 1 if "Reta" in metodo_selecionado else 2
 
     col_x, col_y = st.columns(2)
     with col_x:
@@ -261,7 +373,11 @@ elif metodo_selecionado in ["11. Mínimos Quadrados (Reta)", "12. Mínimos Quadr
         y_pontos = parse_input_list(y_str, None)
 
         try:
-            coeficientes, polinomio_str = ajuste_minimos_quadrados(x_pontos, y_pontos, grau)
+            if caminho_dados:
+                # Leitura em blocos: o arquivo não precisa caber na memória
+                coeficientes, polinomio_str = ajuste_minimos_quadrados_fluxo(caminho_dados.strip(), int(grau))
+            else:
+                coeficientes, polinomio_str = ajuste_minimos_quadrados(x_pontos, y_pontos, int(grau))
 
             st.subheader("Resultado do Ajuste")
             st.success(f"Polinômio: **f(x) ≈ {polinomio_str}**")
@@ -271,8 +387,9 @@ elif metodo_selecionado in ["11. Mínimos Quadrados (Reta)", "12. Mínimos Quadr
             st.error(f"Erro no Ajuste de Curvas: {e}")
 
 
-# --- 8. INTEGRAÇÃO NUMÉRICA (Trapézio e Simpson) ---
-elif metodo_selecionado in ["13. Regra do Trapézio", "14. 1/3 de Simpson"]:
+# --- 8. INTEGRAÇÃO NUMÉRICA (Newton-Cotes: Trapézio, Simpson e Boole) ---
+elif metodo_selecionado in ["13. Regra do Trapézio", "14. 1/3 de Simpson", "20. 3/8 de Simpson",
+                             "21. Regra de Boole"]:
 
     col_a, col_b, col_n = st.columns(3)
     with col_a:
@@ -280,15 +397,21 @@ elif metodo_selecionado in ["13. Regra do Trapézio", "14. 1/3 de Simpson"]:
     with col_b:
         b = st.number_input("Limite Superior (b)", value=1.0, step=0.1)
     with col_n:
-        n = st.number_input("Subintervalos (n)", value=10, min_value=2, step=2)
+        # n deve ser múltiplo do grau da regra (2 para Simpson 1/3, 3 para 3/8, 4 para Boole)
+        passo_n = {"20. 3/8 de Simpson": 3, "21. Regra de Boole": 4}.get(metodo_selecionado, 2)
+        n = st.number_input("Subintervalos (n)", value=(10 // passo_n) * passo_n, min_value=passo_n, step=passo_n)
 
     if st.button(f"Executar {metodo_selecionado}"):
 
         try:
             if metodo_selecionado == "13. Regra do Trapézio":
                 integral = regra_trapezio(f_num, a, b, n)
-            else:  # 1/3 de Simpson
+            elif metodo_selecionado == "14. 1/3 de Simpson":
                 integral = regra_simpson_1_3(f_num, a, b, n)
+            elif metodo_selecionado == "20. 3/8 de Simpson":
+                integral = regra_simpson_3_8(f_num, a, b, n)
+            else:  # Boole
+                integral = regra_boole(f_num, a, b, n)
 
             st.subheader("Resultado")
             st.success(f"Valor da Integral ≈ `{integral:.6f}`")
@@ -296,4 +419,68 @@ elif metodo_selecionado in ["13. Regra do Trapézio", "14. 1/3 de Simpson"]:
         except ValueError as ve:
             st.error(f"Erro de Validação: {ve}")
         except Exception as e:
-            st.error(f"Erro durante a Integração Numérica: {e}")
\ No newline at end of file
+            st.error(f"Erro durante a Integração Numérica: {e}")
+
+
+# --- 9. INTEGRAÇÃO ADAPTATIVA (Simpson Adaptativo e Romberg) ---
+elif metodo_selecionado in ["22. Simpson Adaptativo", "23. Romberg"]:
+    st.info("O número de subintervalos é escolhido automaticamente para atingir a tolerância (tol).")
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        a = st.number_input("Limite Inferior (a)", value=0.0, step=0.1)
+    with col_b:
+        b = st.number_input("Limite Superior (b)", value=1.0, step=0.1)
+
+    if st.button(f"Executar {metodo_selecionado}"):
+
+        try:
+            if metodo_selecionado == "22. Simpson Adaptativo":
+                integral, relatorio = integracao_simpson_adaptativa(f_num, a, b, tol)
+            else:  # Romberg
+                integral, relatorio = integracao_romberg(f_num, a, b, tol)
+
+            st.subheader("Resultado")
+            if relatorio['convergiu']:
+                st.success(f"Valor da Integral ≈ `{integral:.6f}`")
+            else:
+                st.warning(f"Tolerância não atingida. Melhor estimativa: `{integral:.6f}`")
+            st.info(f"Avaliações de f(x): **{relatorio['avaliacoes']}** | "
+                    f"Erro estimado: `{relatorio['erro_estimado']:.2e}`")
+
+            if metodo_selecionado == "23. Romberg":
+                st.subheader("Tabela de Romberg")
+                st.dataframe(pd.DataFrame(relatorio['tabela']).round(8))
+
+        except ValueError as ve:
+            st.error(f"Erro de Validação: {ve}")
+        except Exception as e:
+            st.error(f"Erro durante a Integração Numérica: {e}")
+
+
+# --- 10. QUADRATURA GAUSSIANA (Gauss-Legendre) ---
+elif metodo_selecionado == "24. Gauss-Legendre":
+
+    col_a, col_b, col_n, col_ordem = st.columns(4)
+    with col_a:
+        a = st.number_input("Limite Inferior (a)", value=0.0, step=0.1)
+    with col_b:
+        b = st.number_input("Limite Superior (b)", value=1.0, step=0.1)
+    with col_n:
+        n = st.number_input("Painéis (n)", value=1, min_value=1, step=1)
+    with col_ordem:
+        ordem = st.number_input("Pontos por painel", value=5, min_value=1, max_value=100, step=1)
+
+    if st.button(f"Executar {metodo_selecionado}"):
+
+        try:
+            integral = regra_gauss_legendre(f_num, a, b, n, ordem)
+
+            st.subheader("Resultado")
+            st.success(f"Valor da Integral ≈ `{integral:.10f}`")
+            st.info(f"Avaliações de f(x): **{n * ordem}**")
+
+        except ValueError as ve:
+            st.error(f"Erro de Validação: {ve}")
+        except Exception as e:
+            st.error(f"Erro durante a Integração Numérica: {e}")
@@ -0,0 +1,62 @@
+"""Comparação de tempo: regras do Trapézio e de Simpson 1/3 originais (laço em Python) x motor
+vetorizado de Newton-Cotes.
+
+Uso (dentro da pasta 1.0):  python benchmarks/benchmark_integracao.py [n1 n2 ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from metodos.integracao import regra_simpson_1_3, regra_trapezio  # noqa: E402
+from metodos.utils import criar_funcao  # noqa: E402
+
+
+def regra_trapezio_original(f, a, b, n):
+    """Implementação anterior: uma chamada de f por nó."""
+    h = (b - a) / n
+    soma = 0.5 * (f(a) + f(b))
+    for i in range(1, n):
+        soma += f(a + i * h)
+    return h * soma
+
+
+def regra_simpson_1_3_original(f, a, b, n):
+    """Implementação anterior: uma chamada de f por nó."""
+    h = (b - a) / n
+    soma = f(a) + f(b)
+    for i in range(1, n):
+        x_i = a + i * h
+        if i % 2 == 0:
+            soma += 2 * f(x_i)
+        else:
+            soma += 4 * f(x_i)
+    return (h / 3) * soma
+
+
+def cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main(tamanhos):
+    f = criar_funcao("np.sin(x) * np.exp(-x)")
+    regras = [
+        ("Trapézio", regra_trapezio_original, regra_trapezio),
+        ("Simpson 1/3", regra_simpson_1_3_original, regra_simpson_1_3),
+    ]
+    print(f"{'regra':<12} {'n':>9} {'original (s)':>14} {'vetorizado (s)':>15} {'aceleração':>11} {'|I1 - I2|':>11}")
+    for nome, original, vetorizada in regras:
+        for n in tamanhos:
+            t_original, i_original = cronometrar(original, f, 0.0, 2.0, n)
+            t_novo, i_novo = cronometrar(vetorizada, f, 0.0, 2.0, n)
+
+            diferenca = abs(i_original - i_novo)
+            print(f"{nome:<12} {n:>9} {t_original:>14.4f} {t_novo:>15.4f} "
+                  f"{t_original / t_novo:>10.1f}x {diferenca:>11.2e}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000])
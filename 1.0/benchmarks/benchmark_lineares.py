@@ -0,0 +1,55 @@
+"""Comparação de tempo: eliminação de Gauss original (linha a linha) x fatoração LU em blocos.
+
+Uso (dentro da pasta 1.0):  python benchmarks/benchmark_lineares.py [n1 n2 ...]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from metodos.lineares import metodo_eliminacao_gauss  # noqa: E402
+
+
+def eliminacao_gauss_original(A, b):
+    """Implementação anterior: matriz aumentada e eliminação linha a linha."""
+    n = A.shape[0]
+    M = np.hstack((A, b.reshape(n, 1)))
+
+    for i in range(n):
+        pivot_row = i + np.argmax(np.abs(M[i:, i]))
+        M[[i, pivot_row]] = M[[pivot_row, i]]
+        for j in range(i + 1, n):
+            fator = M[j, i] / M[i, i]
+            M[j, i:] = M[j, i:] - fator * M[i, i:]
+
+    x = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        x[i] = (M[i, n] - np.dot(M[i, i + 1:n], x[i + 1:n])) / M[i, i]
+    return x
+
+
+def cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main(tamanhos):
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'original (s)':>14} {'blocos (s)':>12} {'aceleração':>11} {'|x1 - x2|':>11}")
+    for n in tamanhos:
+        A = rng.standard_normal((n, n))
+        b = rng.standard_normal(n)
+
+        t_original, x_original = cronometrar(eliminacao_gauss_original, A, b)
+        t_novo, (x_novo, _) = cronometrar(metodo_eliminacao_gauss, A, b)
+
+        diferenca = np.max(np.abs(x_original - x_novo))
+        print(f"{n:>6} {t_original:>14.4f} {t_novo:>12.4f} {t_original / t_novo:>10.1f}x {diferenca:>11.2e}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [100, 200, 400, 800, 1600])
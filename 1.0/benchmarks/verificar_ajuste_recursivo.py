@@ -0,0 +1,58 @@
+"""Verificação: ajuste recursivo (online) x ajuste_minimos_quadrados ponderado refeito do zero.
+
+Com fator de esquecimento λ, o ponto de idade t pesa λ^t; com janela, só os últimos pontos
+entram. A cada passo os coeficientes do ajuste recursivo devem coincidir com os do ajuste
+direto com esses pesos. Termina com código 1 se o maior erro relativo passar da tolerância.
+
+Uso (dentro da pasta 1.0):  python benchmarks/verificar_ajuste_recursivo.py [n_pontos]
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from metodos.ajuste_curvas import AjusteMinimosQuadradosRecursivo, ajuste_minimos_quadrados  # noqa: E402
+
+TOLERANCIA = 1e-6
+
+
+def maior_erro(grau, fator_esquecimento, janela, n_pontos, rng):
+    x = rng.uniform(0.0, 10.0, n_pontos)
+    y = 0.4 + 2.2 * x + rng.normal(0.0, 1.0, n_pontos)
+
+    ajuste = AjusteMinimosQuadradosRecursivo(grau, janela=janela, fator_esquecimento=fator_esquecimento)
+    erro = 0.0
+    for i in range(n_pontos):
+        ajuste.adicionar_ponto(x[i], y[i])
+        if i < grau + 5:
+            continue
+        inicio = 0 if janela is None else max(i + 1 - janela, 0)
+        idade = np.arange(i - inicio, -1, -1)
+        esperado, _ = ajuste_minimos_quadrados(x[inicio:i + 1], y[inicio:i + 1], grau,
+                                               pesos=fator_esquecimento ** idade)
+        erro = max(erro, np.max(np.abs(ajuste.coeficientes - esperado)) / max(np.max(np.abs(esperado)), 1.0))
+    return erro
+
+
+def main(n_pontos):
+    rng = np.random.default_rng(0)
+    print(f"{'grau':>4} {'λ':>6} {'janela':>7} {'erro relativo':>14}")
+    pior = 0.0
+    for janela in (None, 50):
+        for fator_esquecimento in (1.0, 0.99, 0.95, 0.9):
+            for grau in (1, 2, 3):
+                erro = maior_erro(grau, fator_esquecimento, janela, n_pontos, rng)
+                pior = max(pior, erro)
+                print(f"{grau:>4} {fator_esquecimento:>6} {str(janela):>7} {erro:>14.2e}")
+
+    if pior > TOLERANCIA:
+        print(f"FALHOU: erro {pior:.2e} acima da tolerância {TOLERANCIA:.0e}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -1,23 +1,23 @@
-import sympy
-from metodos.utils import criar_funcao_simbolica, criar_funcao
+import numpy as np
+from metodos.utils import obter_funcao_compilada, criar_funcao, avaliar_vetorizado, Rastreio
 
 
 # ----------------------------------------------------
 # 3.4 MÉTODO DE NEWTON-RAPHSON
 # ----------------------------------------------------
 
-def metodo_newton_raphson(func_str, x0, tol, max_iter=50):
-    f_expr, x_sym = criar_funcao_simbolica(func_str)
+def metodo_newton_raphson(func_str, x0, tol, max_iter=50, rastreio="tabela"):
+    # A expressão, a derivada e as versões numpy vêm do cache (compiladas uma única vez)
+    funcao = obter_funcao_compilada(func_str)
 
-    if f_expr is None:
+    if funcao.expressao is None:
         raise ValueError("Função simbólica inválida. Verifique a sintaxe.")
 
-    df_expr = sympy.diff(f_expr, x_sym)
-    f = sympy.lambdify(x_sym, f_expr, 'numpy')
-    df = sympy.lambdify(x_sym, df_expr, 'numpy')
+    f = funcao.lambdificada(0)
+    df = funcao.lambdificada(1)
 
     x_i = float(x0)
-    iteracoes = []
+    iteracoes = Rastreio(rastreio, ('x_i', 'f(x_i)', "f'(x_i)", 'x_i+1', '|x_i+1 - x_i|'), max_iter)
     iteracao_cont = 0
 
     while iteracao_cont < max_iter:
@@ -32,32 +32,102 @@ def metodo_newton_raphson(func_str, x0, tol, max_iter=50):
         x_novo = x_i - (fx_i / dfx_i)
         erro = abs(x_novo - x_i)
 
-        iteracoes.append({
-            'Iteração': iteracao_cont,
-            'x_i': f"{x_i:.6f}",
-            'f(x_i)': f"{fx_i:.6f}",
-            "f'(x_i)": f"{dfx_i:.6f}",
-            'x_i+1': f"{x_novo:.6f}",
-            '|x_i+1 - x_i|': f"{erro:.6f}"
-        })
+        iteracoes.registrar(iteracao_cont, x_i, fx_i, dfx_i, x_novo, erro)
 
         if erro < tol:
             break
 
         x_i = x_novo
 
-    return x_i, iteracoes
+    return x_i, iteracoes.resultado()
+
+
+# ----------------------------------------------------
+# 3.4.1 NEWTON-RAPHSON COM VÁRIOS CHUTES INICIAIS
+# ----------------------------------------------------
+
+def _agrupar_raizes(raizes, tol_agrupamento):
+    """Reduz as raízes encontradas às distintas (média de cada grupo de valores próximos)."""
+    if raizes.size == 0:
+        return raizes
+    raizes = np.sort(raizes)
+    novo_grupo = np.concatenate(([True], np.diff(raizes) > tol_agrupamento))
+    grupos = np.cumsum(novo_grupo) - 1
+    return np.bincount(grupos, weights=raizes) / np.bincount(grupos)
+
+
+def metodo_newton_raphson_multiplo(func_str, x0s, tol, max_iter=50, tol_agrupamento=None):
+    """Newton-Raphson partindo de todos os chutes em x0s ao mesmo tempo (vetorizado).
+
+    Os chutes que convergem ou encontram f'(x) ≈ 0 saem do laço, sem interromper os demais.
+    Retorna (raizes_distintas, resultado), onde resultado é um dict de arrays por chute:
+    'x0', 'raiz', 'iteracoes', 'convergiu' e 'derivada_nula'.
+    """
+    funcao = obter_funcao_compilada(func_str)
+
+    if funcao.expressao is None:
+        raise ValueError("Função simbólica inválida. Verifique a sintaxe.")
+
+    f = funcao.lambdificada(0)
+    df = funcao.lambdificada(1)
+
+    x0s = np.array(x0s, dtype=float).ravel()
+    x_i = x0s.copy()
+    iteracoes = np.zeros(x0s.size, dtype=int)
+    convergiu = np.zeros(x0s.size, dtype=bool)
+    derivada_nula = np.zeros(x0s.size, dtype=bool)
+    ativo = np.ones(x0s.size, dtype=bool)
+
+    for _ in range(max_iter):
+        idx = np.nonzero(ativo)[0]
+        if idx.size == 0:
+            break
+        iteracoes[idx] += 1
+
+        x = x_i[idx]
+        with np.errstate(all='ignore'):
+            fx = avaliar_vetorizado(f, x)
+            dfx = avaliar_vetorizado(df, x)
+
+            # f'(x) ≈ 0: o chute é descartado (no método escalar seria um erro)
+            nula = np.abs(dfx) < 1e-10
+            x_novo = x - fx / np.where(nula, 1.0, dfx)
+            erro = np.abs(x_novo - x)
+
+        terminou = erro < tol
+        divergiu = ~nula & ~np.isfinite(x_novo)
+
+        derivada_nula[idx[nula]] = True
+        convergiu[idx[terminou & ~nula]] = True
+        ativo[idx[nula | terminou | divergiu]] = False
+
+        # Como no método escalar, o chute que convergiu mantém o último x_i
+        seguir = ~(nula | terminou | divergiu)
+        x_i[idx[seguir]] = x_novo[seguir]
+
+    if tol_agrupamento is None:
+        tol_agrupamento = 10 * tol
+    raizes_distintas = _agrupar_raizes(x_i[convergiu], tol_agrupamento)
+
+    resultado = {
+        'x0': x0s,
+        'raiz': np.where(convergiu, x_i, np.nan),
+        'iteracoes': iteracoes,
+        'convergiu': convergiu,
+        'derivada_nula': derivada_nula,
+    }
+    return raizes_distintas, resultado
 
 
 # ----------------------------------------------------
 # 3.5 MÉTODO DA SECANTE
 # ----------------------------------------------------
 
-def metodo_secante(f, x_ant, x_i, tol, max_iter=50):
+def metodo_secante(f, x_ant, x_i, tol, max_iter=50, rastreio="tabela"):
     x_ant = float(x_ant)
     x_i = float(x_i)
 
-    iteracoes = []
+    iteracoes = Rastreio(rastreio, ('x_ant', 'x_i', 'f(x_i)', 'x_i+1', '|x_i+1 - x_i|'), max_iter)
     iteracao_cont = 0
 
     while iteracao_cont < max_iter:
@@ -72,14 +142,7 @@ def metodo_secante(f, x_ant, x_i, tol, max_iter=50):
         x_novo = x_i - fx_i * (x_i - x_ant) / (fx_i - fx_ant)
         erro = abs(x_novo - x_i)
 
-        iteracoes.append({
-            'Iteração': iteracao_cont,
-            'x_ant': f"{x_ant:.6f}",
-            'x_i': f"{x_i:.6f}",
-            'f(x_i)': f"{fx_i:.6f}",
-            'x_i+1': f"{x_novo:.6f}",
-            '|x_i+1 - x_i|': f"{erro:.6f}"
-        })
+        iteracoes.registrar(iteracao_cont, x_ant, x_i, fx_i, x_novo, erro)
 
         if erro < tol:
             break
@@ -87,21 +150,21 @@ def metodo_secante(f, x_ant, x_i, tol, max_iter=50):
         x_ant = x_i
         x_i = x_novo
 
-    return x_i, iteracoes
+    return x_i, iteracoes.resultado()
 
 
 # ----------------------------------------------------
 # EXTRA: PONTO FIXO (Iteração)
 # ----------------------------------------------------
 
-def metodo_ponto_fixo(g_str, x0, tol, max_iter=50):
+def metodo_ponto_fixo(g_str, x0, tol, max_iter=50, rastreio="tabela"):
     g = criar_funcao(g_str)
 
     if g is None:
         raise ValueError("Função de iteração g(x) inválida.")
 
     x_i = float(x0)
-    iteracoes = []
+    iteracoes = Rastreio(rastreio, ('x_i', 'g(x_i)', 'x_i+1', '|x_i+1 - x_i|'), max_iter)
     iteracao_cont = 0
 
     while iteracao_cont < max_iter:
@@ -114,13 +177,7 @@ def metodo_ponto_fixo(g_str, x0, tol, max_iter=50):
 
         erro = abs(x_novo - x_i)
 
-        iteracoes.append({
-            'Iteração': iteracao_cont,
-            'x_i': f"{x_i:.6f}",
-            'g(x_i)': f"{x_novo:.6f}",
-            'x_i+1': f"{x_novo:.6f}",
-            '|x_i+1 - x_i|': f"{erro:.6f}"
-        })
+        iteracoes.registrar(iteracao_cont, x_i, x_novo, x_novo, erro)
 
         if erro < tol:
             break
@@ -130,4 +187,122 @@ def metodo_ponto_fixo(g_str, x0, tol, max_iter=50):
     if iteracao_cont == max_iter:
         raise Exception(f"O método não convergiu após {max_iter} iterações. Verifique o critério |g'(x)| < 1.")
 
-    return x_i, iteracoes
\ No newline at end of file
+    return x_i, iteracoes.resultado()
+
+
+# ----------------------------------------------------
+# EXTRA: PONTO FIXO ACELERADO (Aitken Δ² / Steffensen)
+# ----------------------------------------------------
+
+def _extrapolacao_aitken(p0, p1, p2):
+    """Δ² de Aitken: p0 - (p1 - p0)² / (p2 - 2*p1 + p0). Sem denominador, retorna p2."""
+    denominador = p2 - 2 * p1 + p0
+    if abs(denominador) < 1e-14:
+        return p2
+    return p0 - (p1 - p0) ** 2 / denominador
+
+
+def _estimar_iteracoes_sem_aceleracao(p0, p1, p2, tol):
+    """Estima quantas iterações o ponto fixo simples levaria, a partir da taxa |g'| ≈ Δp1/Δp0."""
+    if p1 == p0:
+        return None, 1
+    taxa = (p2 - p1) / (p1 - p0)
+    if not 0 < abs(taxa) < 1:
+        # |g'| >= 1: a iteração simples não converge (taxa 0: converge na primeira iteração)
+        return float(taxa), (None if abs(taxa) >= 1 else 1)
+    k = np.log(tol / abs(p1 - p0)) / np.log(abs(taxa))
+    return float(taxa), int(max(np.ceil(k), 0)) + 1
+
+
+def metodo_ponto_fixo_acelerado(g_str, x0, tol, max_iter=50, metodo="steffensen", rastreio="tabela"):
+    """Ponto fixo com aceleração de convergência.
+
+    metodo="steffensen": cada iteração reinicia a partir da extrapolação de Aitken
+    (convergência quadrática, 2 avaliações de g por iteração).
+    metodo="aitken": aplica o Δ² sobre a sequência do ponto fixo simples (1 avaliação por iteração).
+
+    Retorna (raiz, iteracoes, relatorio); o relatorio compara com a estimativa para a iteração simples.
+    """
+    if metodo not in ("steffensen", "aitken"):
+        raise ValueError("Aceleração inválida. Use 'steffensen' ou 'aitken'.")
+
+    g = criar_funcao(g_str)
+
+    if g is None:
+        raise ValueError("Função de iteração g(x) inválida.")
+
+    def avaliar_g(x):
+        try:
+            return g(x)
+        except Exception as e:
+            raise Exception(f"Erro ao calcular g(x): {e}")
+
+    x_i = float(x0)
+    iteracoes = Rastreio(rastreio, ('x_i', 'g(x_i)', 'x_i+1', '|x_i+1 - x_i|'), max_iter)
+    iteracao_cont = 0
+    avaliacoes = 0
+    convergiu = False
+    primeiros = []  # p0, p1, p2 da iteração simples (para estimar a taxa de contração)
+
+    if metodo == "steffensen":
+        while iteracao_cont < max_iter:
+            iteracao_cont += 1
+
+            x_1 = avaliar_g(x_i)
+            x_2 = avaliar_g(x_1)
+            avaliacoes += 2
+            if not primeiros:
+                primeiros = [x_i, x_1, x_2]
+
+            x_novo = _extrapolacao_aitken(x_i, x_1, x_2)
+            erro = abs(x_novo - x_i)
+
+            iteracoes.registrar(iteracao_cont, x_i, x_1, x_novo, erro)
+
+            x_i = x_novo
+            if erro < tol:
+                convergiu = True
+                break
+
+    else:  # Aitken sobre a sequência simples
+        p_ant, p_i = None, x_i
+        x_acel = x_i
+        while iteracao_cont < max_iter:
+            iteracao_cont += 1
+
+            p_novo = avaliar_g(p_i)
+            avaliacoes += 1
+            if len(primeiros) < 3:
+                primeiros = (primeiros or [p_i]) + [p_novo]
+
+            x_novo = p_novo if p_ant is None else _extrapolacao_aitken(p_ant, p_i, p_novo)
+            erro = abs(x_novo - x_acel)
+
+            iteracoes.registrar(iteracao_cont, p_i, p_novo, x_novo, erro)
+
+            x_acel = x_novo
+            if erro < tol:
+                convergiu = True
+                break
+            p_ant, p_i = p_i, p_novo
+        x_i = x_acel
+
+    if not convergiu:
+        raise Exception(f"O método não convergiu após {max_iter} iterações. Verifique o critério |g'(x)| < 1.")
+
+    if len(primeiros) == 3:
+        taxa, iteracoes_simples = _estimar_iteracoes_sem_aceleracao(*primeiros, tol)
+    else:
+        taxa, iteracoes_simples = None, None
+
+    relatorio = {
+        'metodo': metodo,
+        'iteracoes': iteracao_cont,
+        'avaliacoes_g': avaliacoes,
+        'taxa_contracao_estimada': taxa,
+        # Iteração simples: 1 avaliação de g por iteração (None se ela não converge)
+        'iteracoes_sem_aceleracao_estimadas': iteracoes_simples,
+        'iteracoes_economizadas': None if iteracoes_simples is None else iteracoes_simples - iteracao_cont,
+        'avaliacoes_economizadas': None if iteracoes_simples is None else iteracoes_simples - avaliacoes,
+    }
+    return x_i, iteracoes.resultado(), relatorio
@@ -1,3 +1,7 @@
+import itertools
+import os
+from collections import deque
+
 import numpy as np
 
 
@@ -5,7 +9,7 @@ import numpy as np
 # 6.1 MÍNIMOS QUADRADOS (Reta e Parábola)
 # ----------------------------------------------------
 
-def ajuste_minimos_quadrados(x_pontos, y_pontos, grau):
+def ajuste_minimos_quadrados(x_pontos, y_pontos, grau, pesos=None):
     n = len(x_pontos)
     x = np.array(x_pontos, dtype=float)
     y = np.array(y_pontos, dtype=float)
@@ -13,26 +17,264 @@ def ajuste_minimos_quadrados(x_pontos, y_pontos, grau):
     if n < grau + 1:
         raise ValueError(f"São necessários pelo menos {grau + 1} pontos para um ajuste de grau {grau}.")
 
-    # Monta a matriz do sistema normal [A][C] = [B]
-    A = np.zeros((grau + 1, grau + 1))
-    B = np.zeros(grau + 1)
+    # Monta a matriz do sistema normal [A][C] = [B] a partir dos somatórios de potências
+    acumulador = AcumuladorMinimosQuadrados(grau)
+    acumulador.acumular(x, y, pesos)
+
+    return acumulador.resultado()
 
-    for i in range(grau + 1):
-        for j in range(grau + 1):
-            A[i, j] = np.sum(x ** (i + j))
-        B[i] = np.sum(y * x ** i)
 
+def _resolver_equacoes_normais(A, B):
     # Resolve o sistema linear A * Coeficientes = B
     try:
-        coeficientes = np.linalg.solve(A, B)
+        return np.linalg.solve(A, B)
     except np.linalg.LinAlgError:
         raise Exception("O sistema de equações normais é singular ou mal condicionado.")
 
+
+def _formatar_polinomio(coeficientes):
     # Formatação da função resultante para exibição
     polinomio_str = " + ".join(
         [f"{c:.4f}x^{i}" if i > 1 else f"{c:.4f}x" if i == 1 else f"{c:.4f}"
          for i, c in enumerate(coeficientes)]
     )
-    polinomio_str = polinomio_str.replace("x^1", "x").replace("x^0", "")
+    return polinomio_str.replace("x^1", "x").replace("x^0", "")
+
+
+# ----------------------------------------------------
+# 6.2 MÍNIMOS QUADRADOS EM FLUXO (Qualquer grau, memória constante)
+# ----------------------------------------------------
+
+class AcumuladorMinimosQuadrados:
+    """Acumula, bloco a bloco, os somatórios do sistema normal de um ajuste polinomial.
+
+    Guarda só S_k = Σ x^k (k = 0..2·grau) e T_k = Σ y·x^k (k = 0..grau): a memória não
+    depende do número de pontos. Em cada bloco, cada potência de x é calculada uma única vez.
+    """
+
+    def __init__(self, grau):
+        if grau < 0:
+            raise ValueError("O grau deve ser não negativo.")
+        self.grau = int(grau)
+        self.n = 0
+        self.somas_x = np.zeros(2 * self.grau + 1)
+        self.somas_xy = np.zeros(self.grau + 1)
+
+    def acumular(self, x_bloco, y_bloco, pesos=None):
+        x = np.asarray(x_bloco, dtype=float).ravel()
+        y = np.asarray(y_bloco, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError("O número de pontos x e y deve ser o mesmo.")
+
+        # Com pesos, os somatórios passam a ser Σ w·x^k e Σ w·y·x^k
+        if pesos is None:
+            w = np.ones_like(x)
+        else:
+            w = np.asarray(pesos, dtype=float).ravel()
+            if w.size != x.size:
+                raise ValueError("O número de pesos deve ser igual ao número de pontos.")
+        wy = w * y
+
+        potencia = np.ones_like(x)
+        self.somas_x[0] += np.sum(w)
+        self.somas_xy[0] += np.sum(wy)
+        for k in range(1, 2 * self.grau + 1):
+            potencia *= x  # x^k a partir de x^(k-1)
+            self.somas_x[k] += np.dot(w, potencia)
+            if k <= self.grau:
+                self.somas_xy[k] += np.dot(wy, potencia)
+        self.n += x.size
+
+    def sistema_normal(self):
+        """Retorna (A, B) com A[i, j] = Σ w·x^(i+j) e B[i] = Σ w·y·x^i."""
+        indices = np.add.outer(np.arange(self.grau + 1), np.arange(self.grau + 1))
+        return self.somas_x[indices], self.somas_xy.copy()
+
+    def resultado(self):
+        """Retorna (coeficientes, polinomio_str), como ajuste_minimos_quadrados."""
+        if self.n < self.grau + 1:
+            raise ValueError(f"São necessários pelo menos {self.grau + 1} pontos para um ajuste de grau {self.grau}.")
+
+        coeficientes = _resolver_equacoes_normais(*self.sistema_normal())
+        return coeficientes, _formatar_polinomio(coeficientes)
+
+
+def _blocos_csv(caminho, tamanho_bloco, delimitador, pular_linhas):
+    with open(caminho) as arquivo:
+        for _ in range(pular_linhas):
+            next(arquivo, None)
+        while True:
+            linhas = list(itertools.islice(arquivo, tamanho_bloco))
+            if not linhas:
+                break
+            if not any(linha.strip() for linha in linhas):
+                continue  # Bloco só com linhas em branco (ex: linha vazia no fim do arquivo)
+            dados = np.loadtxt(linhas, delimiter=delimitador, ndmin=2)
+            if dados.size == 0:
+                continue
+            yield dados[:, 0], dados[:, 1]
+
+
+def _blocos_array(dados, tamanho_bloco):
+    if dados.ndim != 2 or dados.shape[1] < 2:
+        raise ValueError("O array de dados deve ter formato (N, 2): colunas x e y.")
+    for ini in range(0, dados.shape[0], tamanho_bloco):
+        bloco = np.asarray(dados[ini:ini + tamanho_bloco], dtype=float)
+        yield bloco[:, 0], bloco[:, 1]
+
+
+def ajuste_minimos_quadrados_fluxo(fonte, grau, tamanho_bloco=1_000_000, delimitador=",", pular_linhas=0):
+    """Ajuste polinomial de qualquer grau em uma única passada pelos dados, com memória constante.
+
+    fonte pode ser:
+      - um iterável de blocos (x_bloco, y_bloco);
+      - um array (N, 2) ou np.memmap com as colunas x e y;
+      - o caminho de um .npy (aberto com mmap) ou de um CSV com x e y nas duas primeiras colunas.
+    Retorna (coeficientes, polinomio_str), como ajuste_minimos_quadrados.
+    """
+    tamanho_bloco = max(int(tamanho_bloco), 1)
+
+    if isinstance(fonte, (str, os.PathLike)):
+        if str(fonte).endswith(".npy"):
+            blocos = _blocos_array(np.load(fonte, mmap_mode='r'), tamanho_bloco)
+        else:
+            blocos = _blocos_csv(fonte, tamanho_bloco, delimitador, pular_linhas)
+    elif isinstance(fonte, np.ndarray):
+        blocos = _blocos_array(fonte, tamanho_bloco)
+    else:
+        blocos = fonte
+
+    acumulador = AcumuladorMinimosQuadrados(grau)
+    for x_bloco, y_bloco in blocos:
+        acumulador.acumular(x_bloco, y_bloco)
+
+    return acumulador.resultado()
+
+
+# ----------------------------------------------------
+# 6.3 MÍNIMOS QUADRADOS RECURSIVO (Janela deslizante e esquecimento exponencial)
+# ----------------------------------------------------
+
+class AjusteMinimosQuadradosRecursivo:
+    """Ajuste polinomial online: cada ponto novo atualiza o ajuste em O(grau²).
+
+    Mantém os coeficientes e P = (XᵀWX)⁻¹, atualizados por Sherman-Morrison. Com `janela`,
+    o ponto mais antigo é removido (downdate) quando a janela enche. Com fator_esquecimento
+    λ < 1, um ponto de idade t pesa peso·λ^t. Com λ = 1 e pesos unitários, o resultado é o
+    mesmo de ajuste_minimos_quadrados sobre os pontos da janela.
+
+    A cada `recalcular_a_cada` atualizações o ajuste é refeito diretamente, para que o erro
+    de arredondamento das atualizações não se acumule. Por padrão, uma vez por janela (ou a
+    cada 1000 pontos sem janela), o que mantém o custo amortizado; 0 desativa.
+    """
+
+    def __init__(self, grau, janela=None, fator_esquecimento=1.0, recalcular_a_cada=None):
+        if grau < 0:
+            raise ValueError("O grau deve ser não negativo.")
+        if janela is not None and janela < grau + 1:
+            raise ValueError(f"A janela deve ter pelo menos {grau + 1} pontos para um ajuste de grau {grau}.")
+        if not 0.0 < fator_esquecimento <= 1.0:
+            raise ValueError("O fator de esquecimento deve estar no intervalo (0, 1].")
+
+        self.grau = int(grau)
+        self.janela = janela
+        self.fator_esquecimento = float(fator_esquecimento)
+        if recalcular_a_cada is None:
+            recalcular_a_cada = janela if janela is not None else 1000
+        self.recalcular_a_cada = int(recalcular_a_cada)
+
+        self.coeficientes = None
+        self._P = None
+        self._passo = 0
+        self._atualizacoes = 0
+        # Com janela, guarda os pontos (x, y, peso, passo) para poder removê-los depois;
+        # sem janela, bastam os somatórios (com esquecimento) para o recálculo direto.
+        self._pontos = deque() if janela is not None else None
+        self._somas = AcumuladorMinimosQuadrados(self.grau) if janela is None else None
+
+    def __len__(self):
+        return len(self._pontos) if self._pontos is not None else self._somas.n
+
+    def adicionar_ponto(self, x, y, peso=1.0):
+        x, y, peso = float(x), float(y), float(peso)
+        if peso <= 0:
+            raise ValueError("O peso de cada ponto deve ser positivo.")
+        lam = self.fator_esquecimento
+        self._passo += 1
+
+        removido = None
+        if self._pontos is not None:
+            self._pontos.append((x, y, peso, self._passo))
+            if len(self._pontos) > self.janela:
+                removido = self._pontos.popleft()
+        else:
+            self._somas.somas_x *= lam
+            self._somas.somas_xy *= lam
+            self._somas.acumular([x], [y], [peso])
+
+        if self._P is None:
+            self._recalcular()
+            return self
+
+        if lam < 1.0:
+            self._P /= lam  # todos os pontos antigos perdem um fator λ
+        self._atualizar(x, y, peso)
+        if removido is not None:
+            x_r, y_r, peso_r, passo_r = removido
+            self._atualizar(x_r, y_r, -peso_r * lam ** (self._passo - passo_r))
+
+        self._atualizacoes += 1
+        if self.recalcular_a_cada and self._atualizacoes >= self.recalcular_a_cada:
+            self._recalcular()
+        return self
+
+    def adicionar_pontos(self, x_pontos, y_pontos, pesos=None):
+        if pesos is None:
+            pesos = itertools.repeat(1.0)
+        for x, y, peso in zip(x_pontos, y_pontos, pesos):
+            self.adicionar_ponto(x, y, peso)
+        return self
+
+    def _atualizar(self, x, y, peso):
+        # Sherman-Morrison: (A + w·φφᵀ)⁻¹ = P - w·Pφ(Pφ)ᵀ / (1 + w·φᵀPφ); peso < 0 remove o ponto
+        phi = x ** np.arange(self.grau + 1)
+        P_phi = self._P @ phi
+        ganho = P_phi * (peso / (1.0 + peso * (phi @ P_phi)))
+        self.coeficientes = self.coeficientes + ganho * (y - phi @ self.coeficientes)
+        self._P -= np.outer(ganho, P_phi)
+        # P é simétrica; sem isso o arredondamento a torna assimétrica e, com λ < 1
+        # (P /= λ a cada ponto), o erro cresce até o ajuste divergir
+        self._P = (self._P + self._P.T) / 2
+
+    def _recalcular(self):
+        """Refaz o ajuste diretamente a partir das equações normais."""
+        if self._pontos is not None:
+            acumulador = AcumuladorMinimosQuadrados(self.grau)
+            if self._pontos:
+                x, y, peso, passo = (np.array(c, dtype=float) for c in zip(*self._pontos))
+                acumulador.acumular(x, y, peso * self.fator_esquecimento ** (self._passo - passo))
+        else:
+            acumulador = self._somas
+
+        self._atualizacoes = 0
+        if acumulador.n < self.grau + 1:
+            return
+        A, B = acumulador.sistema_normal()
+        try:
+            self._P = np.linalg.inv(A)
+            self.coeficientes = _resolver_equacoes_normais(A, B)
+        except Exception:
+            # Pontos ainda insuficientes para determinar o polinômio (ex.: x repetidos)
+            self._P = None
+            self.coeficientes = None
+
+    def resultado(self):
+        """Retorna (coeficientes, polinomio_str), como ajuste_minimos_quadrados."""
+        if self.coeficientes is None:
+            raise ValueError(f"São necessários pelo menos {self.grau + 1} pontos para um ajuste de grau {self.grau}.")
+        return self.coeficientes.copy(), _formatar_polinomio(self.coeficientes)
 
-    return coeficientes, polinomio_str
\ No newline at end of file
+    def __call__(self, x):
+        if self.coeficientes is None:
+            raise ValueError("O ajuste ainda não possui pontos suficientes.")
+        return np.polyval(self.coeficientes[::-1], np.asarray(x, dtype=float))
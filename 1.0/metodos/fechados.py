@@ -1,4 +1,7 @@
-# Não precisamos importar math/numpy aqui, pois 'f' é uma função lambda já criada
+import numpy as np
+from metodos.utils import avaliar_vetorizado, Rastreio
+from metodos.paralelo import resolver_funcao, abrir_executor, mapear_em_ordem, definir_tamanho_bloco
+
 
 def isolamento_raiz(f, pi, pf, passo=1.0):
     """Realiza a busca incremental no intervalo [pi, pf]."""
@@ -29,11 +32,160 @@ def isolamento_raiz(f, pi, pf, passo=1.0):
     return None, None
 
 
+# ----------------------------------------------------
+# 3.0 ISOLAMENTO VETORIZADO (Todas as raízes)
+# ----------------------------------------------------
+
+def _intervalos_com_troca_de_sinal(x, fx, inicio=0):
+    """Índices i (>= inicio) dos intervalos [x_i, x_i+1] com troca de sinal estrita (f ≠ 0 nas pontas)."""
+    troca = fx[:-1] * fx[1:] < 0
+    troca[:inicio] = False
+    return np.nonzero(troca)[0]
+
+
+def _intervalos_vizinhos_de_zero(fx, inicio=0):
+    """Índices i (>= inicio) dos intervalos [x_i, x_i+1] com exatamente uma ponta em que f = 0.
+
+    Um nó da malha que cai sobre uma raiz não mostra troca de sinal nos intervalos vizinhos,
+    escondendo outra raiz que esteja neles; esses intervalos são varridos com passo menor.
+    """
+    zero = fx == 0
+    vizinho = zero[:-1] ^ zero[1:]
+    vizinho[:inicio] = False
+    return np.nonzero(vizinho)[0]
+
+
+def _candidatos_refino(x, fx, inicio=1):
+    """Índices i (>= inicio) onde |f| tem um mínimo local sem troca de sinal em [x_i-1, x_i+1].
+
+    A parábola que passa pelos três pontos indica se o vértice cruza o zero
+    (tangência ou par de raízes próximas que o passo fixo não separou).
+    Retorna os índices e a abscissa do vértice de cada um.
+    """
+    inicio = max(inicio, 1)
+    if fx.size < 3 or inicio > fx.size - 2:
+        return np.empty(0, dtype=int), np.empty(0)
+
+    f_esq, f_meio, f_dir = fx[inicio - 1:-2], fx[inicio:-1], fx[inicio + 1:]
+    x_esq, x_meio, x_dir = x[inicio - 1:-2], x[inicio:-1], x[inicio + 1:]
+
+    mesmo_sinal = (f_esq * f_meio > 0) & (f_meio * f_dir > 0)
+    minimo_local = (np.abs(f_meio) < np.abs(f_esq)) & (np.abs(f_meio) <= np.abs(f_dir))
+    candidatos = mesmo_sinal & minimo_local
+
+    # Vértice da parábola interpoladora (diferenças divididas)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = (f_meio - f_esq) / (x_meio - x_esq)
+        d2 = ((f_dir - f_meio) / (x_dir - x_meio) - d1) / (x_dir - x_esq)
+        x_v = (x_esq + x_meio) / 2 - d1 / (2 * d2)
+        f_v = f_esq + d1 * (x_v - x_esq) + d2 * (x_v - x_esq) * (x_v - x_meio)
+    # Tolerância de arredondamento: numa tangência exata o vértice dá f_v ≈ 0 com qualquer sinal
+    folga = 64 * np.finfo(float).eps * np.maximum(np.abs(f_esq), np.abs(f_dir))
+    candidatos &= (d2 != 0) & (f_v * np.sign(f_meio) <= folga)
+
+    indices = np.nonzero(candidatos)[0]
+    return inicio + indices, x_v[indices]
+
+
+def _analisar_malha(f, x, fx, inicio, nos, niveis, subdivisoes):
+    """Colchetes (a, b) e tangências da malha x: trocas de sinal nos intervalos i >= inicio,
+    nós zero dentro da fatia `nos` (como [x_i, x_i]) e o que o refino encontrar."""
+    idx = _intervalos_com_troca_de_sinal(x, fx, inicio)
+    zeros = np.arange(x.size)[nos][fx[nos] == 0]
+    a_lista, b_lista = [x[idx], x[zeros]], [x[idx + 1], x[zeros]]
+    tangencias = []
+
+    if niveis > 0:
+        for i in _intervalos_vizinhos_de_zero(fx, inicio):
+            a_ref, b_ref, t_ref = _refinar(f, x[i], x[i + 1], niveis, subdivisoes)
+            a_lista.append(a_ref)
+            b_lista.append(b_ref)
+            tangencias.append(t_ref)
+
+        for i, x_v in zip(*_candidatos_refino(x, fx, inicio)):
+            a_ref, b_ref, t_ref = _refinar(f, x[i - 1], x[i + 1], niveis, subdivisoes)
+            a_lista.append(a_ref)
+            b_lista.append(b_ref)
+            if a_ref.size == 0:
+                # O refino não separou raízes: |f| só encosta no zero (tangência)
+                tangencias.append(t_ref if t_ref.size else np.array([x_v]))
+            else:
+                tangencias.append(t_ref)
+
+    return np.concatenate(a_lista), np.concatenate(b_lista), np.concatenate(tangencias or [np.empty(0)])
+
+
+def _refinar(f, x_esq, x_dir, niveis, subdivisoes):
+    """Varre [x_esq, x_dir] com passo menor, procurando as raízes que o passo grosso perdeu."""
+    x = np.linspace(x_esq, x_dir, 2 * subdivisoes + 1)
+    fx = avaliar_vetorizado(f, x)
+    # As pontas são nós da malha anterior: um zero nelas já foi informado por ela
+    return _analisar_malha(f, x, fx, 0, slice(1, -1), niveis - 1, subdivisoes)
+
+
+def _varrer_bloco(f, pi, pf, passo, k, k_fim, refinar, niveis_refino, subdivisoes):
+    """Intervalos com raiz entre os nós k..k_fim-1 da malha (e o intervalo que liga ao bloco anterior)."""
+    f = resolver_funcao(f)
+
+    # Os 2 últimos nós do bloco anterior entram de novo, para não perder trocas de sinal
+    # nem mínimos de |f| na fronteira entre blocos
+    k_ini = max(k - 2, 0)
+    x = np.minimum(pi + np.arange(k_ini, k_fim) * passo, pf)
+    fx = avaliar_vetorizado(f, x)
+    inicio = max(k - k_ini - 1, 0)
+
+    niveis = niveis_refino if refinar else 0
+    return _analisar_malha(f, x, fx, inicio, slice(k - k_ini, None), niveis, subdivisoes)
+
+
+def isolamento_raizes_vetorizado(f, pi, pf, passo=1.0, refinar=True, niveis_refino=3,
+                                 subdivisoes=8, tamanho_bloco=None, executor=None, max_workers=None,
+                                 tangencias=False):
+    """Busca incremental vetorizada: retorna TODOS os intervalos [a, b] com raiz em [pi, pf].
+
+    f é avaliada na malha inteira de uma só vez (em blocos de até 'tamanho_bloco' pontos, por
+    padrão 100 000, para não manter malhas muito grandes na memória). Com refinar=True, os trechos onde |f|
+    se aproxima de zero sem trocar de sinal são varridos novamente com passo menor, assim
+    como os intervalos vizinhos de um nó em que f = 0.
+
+    Um nó da malha que cai exatamente sobre uma raiz é retornado como o colchete degenerado
+    [x_i, x_i]. Raízes de multiplicidade par (tangências) não trocam de sinal e por isso não
+    geram colchetes; com tangencias=True, as abscissas em que o refino encontrou |f| encostando
+    no zero são retornadas num terceiro array.
+
+    Com executor ('processos', 'threads' ou um Executor), os blocos da malha são varridos
+    pelos workers; sem tamanho_bloco, a malha é dividida em paralelo.BLOCOS_PARALELOS blocos.
+    O resultado é o mesmo para qualquer número de workers. Com 'processos', passe f como string.
+
+    Retorna dois arrays (a, b) ordenados (e as tangências, se pedidas); vazios se nenhuma
+    raiz for isolada.
+    """
+    if passo <= 0:
+        raise ValueError("O passo deve ser positivo.")
+    if pf <= pi:
+        return (np.empty(0), np.empty(0), np.empty(0)) if tangencias else (np.empty(0), np.empty(0))
+
+    n_passos = int(np.ceil((pf - pi) / passo))
+    tamanho_bloco = max(definir_tamanho_bloco(tamanho_bloco, n_passos + 1, executor, 100_000), 3)
+
+    tarefas = [(f, pi, pf, passo, k, min(k + tamanho_bloco, n_passos + 1), refinar, niveis_refino, subdivisoes)
+               for k in range(0, n_passos + 1, tamanho_bloco)]
+    with abrir_executor(executor, max_workers) as pool:
+        blocos = mapear_em_ordem(_varrer_bloco, tarefas, pool)
+
+    a = np.concatenate([a_bloco for a_bloco, _, _ in blocos])
+    b = np.concatenate([b_bloco for _, b_bloco, _ in blocos])
+    ordem = np.argsort(a, kind='stable')
+    if tangencias:
+        return a[ordem], b[ordem], np.sort(np.concatenate([t_bloco for _, _, t_bloco in blocos]))
+    return a[ordem], b[ordem]
+
+
 # ----------------------------------------------------
 # 3.1 MÉTODO DA BISSECÇÃO
 # ----------------------------------------------------
 
-def metodo_bisseccao(f, a_inicial, b_inicial, tol, max_iter=50):
+def metodo_bisseccao(f, a_inicial, b_inicial, tol, max_iter=50, rastreio="tabela"):
     a = a_inicial
     b = b_inicial
     fa = f(a)
@@ -42,7 +194,7 @@ def metodo_bisseccao(f, a_inicial, b_inicial, tol, max_iter=50):
     if fa * f(b) > 0:
         raise ValueError("f(a) e f(b) devem ter sinais opostos.")
     
-    iteracoes = []
+    iteracoes = Rastreio(rastreio, ('a', 'b', 'm', 'f(m)', '|b-a|'), max_iter)
     iteracao_cont = 0
 
     #Passo 1:
@@ -55,20 +207,13 @@ def metodo_bisseccao(f, a_inicial, b_inicial, tol, max_iter=50):
         #Passo 3:
         f_m = f(m)
 
-        iteracoes.append({
-            'Iteração': iteracao_cont,
-            'a': f"{a:.6f}",
-            'b': f"{b:.6f}",
-            'm': f"{m:.6f}",
-            'f(m)': f"{f_m:.6f}",
-            '|b-a|': f"{abs(b - a):.6f}"
-        })
+        iteracoes.registrar(iteracao_cont, a, b, m, f_m, abs(b - a))
         #Verificação de segurança (Se atendida, quebra loop)
         if abs(f_m) < 1e-10:
             break
 
-        #Passo 3.1:
-        if fa * f_m < 0:
+        #Passo 3.1 (fa = 0: a raiz é a própria ponta a, então b se aproxima dela):
+        if fa * f_m <= 0:
             b = m
         else:
             a = m
@@ -77,14 +222,14 @@ def metodo_bisseccao(f, a_inicial, b_inicial, tol, max_iter=50):
 
     #Final da iteração
     r_a = (a + b) / 2
-    return r_a, iteracoes
+    return r_a, iteracoes.resultado()
 
 
 # ----------------------------------------------------
 # 3.2 MÉTODO DA POSIÇÃO FALSA (Regra Falsa)
 # ----------------------------------------------------
 
-def metodo_posicao_falsa(f, a_inicial, b_inicial, tol, max_iter=50):
+def metodo_posicao_falsa(f, a_inicial, b_inicial, tol, max_iter=50, rastreio="tabela"):
     a = a_inicial
     b = b_inicial
     fa = f(a)
@@ -93,7 +238,7 @@ def metodo_posicao_falsa(f, a_inicial, b_inicial, tol, max_iter=50):
     if fa * fb > 0:
         raise ValueError("f(a) e f(b) devem ter sinais opostos.")
 
-    iteracoes = []
+    iteracoes = Rastreio(rastreio, ('a', 'b', 'm', 'f(m)', '|b-a|'), max_iter)
     iteracao_cont = 0
 
     while (b - a) > tol and iteracao_cont < max_iter:
@@ -102,14 +247,7 @@ def metodo_posicao_falsa(f, a_inicial, b_inicial, tol, max_iter=50):
         m = (a * fb - b * fa) / (fb - fa)
         f_m = f(m)
 
-        iteracoes.append({
-            'Iteração': iteracao_cont,
-            'a': f"{a:.6f}",
-            'b': f"{b:.6f}",
-            'm': f"{m:.6f}",
-            'f(m)': f"{f_m:.6f}",
-            '|b-a|': f"{abs(b - a):.6f}"
-        })
+        iteracoes.registrar(iteracao_cont, a, b, m, f_m, abs(b - a))
 
         if abs(f_m) < 1e-10:
             break
@@ -122,4 +260,182 @@ def metodo_posicao_falsa(f, a_inicial, b_inicial, tol, max_iter=50):
             fa = f_m
 
     r_a = (a * fb - b * fa) / (fb - fa)
-    return r_a, iteracoes
+    return r_a, iteracoes.resultado()
+
+
+# ----------------------------------------------------
+# 3.3 BISSECÇÃO E POSIÇÃO FALSA EM LOTE (Vários intervalos de uma vez)
+# ----------------------------------------------------
+
+def _metodo_fechado_lote(f, a_inicial, b_inicial, tol, max_iter, posicao_falsa, alvos, tol_f):
+    """Itera todos os intervalos [a_k, b_k] em conjunto, congelando os que já convergiram."""
+    a = np.array(a_inicial, dtype=float).ravel()
+    b = np.broadcast_to(np.array(b_inicial, dtype=float).ravel(), a.shape).copy()
+    alvos = np.zeros(a.size) if alvos is None else np.broadcast_to(np.array(alvos, dtype=float).ravel(), a.shape)
+
+    def avaliar(x, idx):
+        # Cada intervalo resolve f(x) = alvo próprio
+        return avaliar_vetorizado(f, x) - alvos[idx]
+
+    todos = np.arange(a.size)
+    fa = avaliar(a, todos)
+    fb = avaliar(b, todos)
+
+    iteracoes = np.zeros(a.size, dtype=int)
+    convergiu = np.zeros(a.size, dtype=bool)
+
+    # Intervalos sem troca de sinal não são resolvidos (ficam com raiz NaN)
+    valido = fa * fb <= 0
+
+    # Raiz numa das pontas (ex: colchete degenerado [x_i, x_i] do isolamento): já resolvida
+    zero_a = valido & (fa == 0)
+    zero_b = valido & (fb == 0) & ~zero_a
+    b[zero_a], fb[zero_a] = a[zero_a], fa[zero_a]
+    a[zero_b], fa[zero_b] = b[zero_b], fb[zero_b]
+
+    ativo = valido & ((b - a) > tol)
+    convergiu[valido & ~ativo] = True
+
+    for _ in range(max_iter):
+        idx = np.nonzero(ativo)[0]
+        if idx.size == 0:
+            break
+
+        a_i, b_i, fa_i, fb_i = a[idx], b[idx], fa[idx], fb[idx]
+        if posicao_falsa:
+            m = (a_i * fb_i - b_i * fa_i) / (fb_i - fa_i)
+        else:
+            m = (a_i + b_i) / 2
+        f_m = avaliar(m, idx)
+        iteracoes[idx] += 1
+
+        # Mesmo critério de parada do método escalar: |f(m)| < tol_f (padrão 1e-10), ou raiz exata
+        parou = (np.abs(f_m) < tol_f) | (f_m == 0)
+        # fa = 0: a raiz é a própria ponta a, então o intervalo encolhe em direção a ela
+        esquerda = ~parou & ((fa_i * f_m < 0) | (fa_i == 0))
+        direita = ~parou & ~esquerda
+
+        b[idx[esquerda]] = m[esquerda]
+        fb[idx[esquerda]] = f_m[esquerda]
+        a[idx[direita]] = m[direita]
+        fa[idx[direita]] = f_m[direita]
+        # Ponto médio exato: força a e b para m, de modo que a raiz final seja m
+        a[idx[parou]] = b[idx[parou]] = m[parou]
+        fa[idx[parou]] = fb[idx[parou]] = f_m[parou]
+
+        terminou = parou | ((b[idx] - a[idx]) <= tol)
+        convergiu[idx[terminou]] = True
+        ativo[idx[terminou]] = False
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if posicao_falsa:
+            raizes = np.where(fb != fa, (a * fb - b * fa) / (fb - fa), (a + b) / 2)
+        else:
+            raizes = (a + b) / 2
+    raizes[~valido] = np.nan
+
+    return raizes, iteracoes, convergiu
+
+
+def metodo_bisseccao_lote(f, a_inicial, b_inicial, tol, max_iter=50, alvos=None, tol_f=1e-10):
+    """Bissecção aplicada a vários intervalos ao mesmo tempo (ex: saída de isolamento_raizes_vetorizado).
+
+    alvos (opcional): resolve f(x) = alvos[k] no intervalo k, em vez de f(x) = 0.
+    tol_f: também para quando |f(m)| < tol_f. O padrão (1e-10) é o do método escalar, que é
+    absoluto; para f em outra escala, passe um valor proporcional a ela (ou 0 para usar só tol).
+    Retorna (raizes, iteracoes, convergiu), arrays com um elemento por intervalo.
+    Intervalos sem troca de sinal resultam em raiz NaN e convergiu=False.
+    """
+    return _metodo_fechado_lote(f, a_inicial, b_inicial, tol, max_iter, False, alvos, tol_f)
+
+
+def metodo_posicao_falsa_lote(f, a_inicial, b_inicial, tol, max_iter=50, alvos=None, tol_f=1e-10):
+    """Posição Falsa aplicada a vários intervalos ao mesmo tempo. Mesmo retorno de metodo_bisseccao_lote."""
+    return _metodo_fechado_lote(f, a_inicial, b_inicial, tol, max_iter, True, alvos, tol_f)
+
+
+# ----------------------------------------------------
+# 3.6 MÉTODO DE BRENT (Híbrido: Bissecção + Secante + Interpolação Quadrática Inversa)
+# ----------------------------------------------------
+
+def metodo_brent(f, a_inicial, b_inicial, tol, max_iter=1000, rastreio="tabela"):
+    """Combina a segurança da bissecção com a velocidade da secante e da interpolação
+    quadrática inversa. A raiz fica sempre isolada em [b, c], então a convergência é garantida.
+
+    No pior caso o método gasta da ordem de log2((b - a) / tol)² iterações (ex: raízes múltiplas),
+    bem acima do que a bissecção pura precisaria; por isso o limite padrão é alto. Se max_iter
+    for atingido antes da tolerância, é levantada uma exceção.
+
+    Retorna (raiz, iteracoes, avaliacoes), onde avaliacoes é o número de chamadas a f.
+    """
+    a = float(a_inicial)
+    b = float(b_inicial)
+    fa = f(a)
+    fb = f(b)
+    avaliacoes = 2
+
+    if fa * fb > 0:
+        raise ValueError("f(a) e f(b) devem ter sinais opostos.")
+
+    iteracoes = Rastreio(rastreio, ('a', 'b', 'x_i+1', 'f(x_i+1)', '|b-a|'), max_iter)
+    if fa == 0:
+        return a, iteracoes.resultado(), avaliacoes
+
+    eps = np.finfo(float).eps
+    c, fc = b, fb
+    d = e = b - a
+    iteracao_cont = 0
+
+    while True:
+        # c é o ponto que mantém a raiz isolada junto com b
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        # b é sempre a melhor estimativa (menor |f|)
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * eps * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0:
+            return b, iteracoes.resultado(), avaliacoes
+        if iteracao_cont >= max_iter:
+            raise Exception(f"O método não convergiu após {max_iter} iterações.")
+
+        iteracao_cont += 1
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Passo da secante
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                # Passo da interpolação quadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            # Aceita o passo interpolado só se ele cair dentro do intervalo e reduzir o passo
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = xm
+                e = d
+        else:
+            # Passo da bissecção
+            d = xm
+            e = d
+
+        a_reg, b_reg = min(b, c), max(b, c)
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else np.copysign(tol1, xm)
+        fb = f(b)
+        avaliacoes += 1
+
+        iteracoes.registrar(iteracao_cont, a_reg, b_reg, b, fb, b_reg - a_reg)
@@ -1,40 +1,345 @@
+from fractions import Fraction
+
 import numpy as np
 
+from metodos.utils import avaliar_vetorizado
+from metodos.paralelo import (
+    resolver_funcao, abrir_executor, mapear_em_ordem, avaliar_em_blocos, definir_tamanho_bloco
+)
+
 
 # ----------------------------------------------------
-# 7.2 REGRA DO TRAPÉZIO
+# 7.1 NEWTON-COTES FECHADAS (Motor vetorizado)
 # ----------------------------------------------------
 
-def regra_trapezio(f, a, b, n):
-    """Regra do Trapézio (composta)"""
+# Maior número de nós avaliados de uma vez (limita a memória para n muito grande)
+TAMANHO_BLOCO_PADRAO = 1_000_000
+
+# Tabelas de pesos já calculadas, indexadas pelo grau da regra
+_PESOS_NEWTON_COTES = {}
+
+
+def pesos_newton_cotes(grau):
+    """Pesos exatos (Fraction) da regra de Newton-Cotes fechada de grau `grau`, em unidades de h.
+
+    ∫[x0, x0 + grau·h] f ≈ h · Σ w_j f(x0 + j·h). Ex.: grau 1 → (1/2, 1/2), grau 2 → (1/3, 4/3, 1/3).
+    Cada w_j = ∫[0, grau] ℓ_j(t) dt, com ℓ_j o polinômio de Lagrange nos nós 0, 1, ..., grau.
+    """
+    grau = int(grau)
+    if grau < 1:
+        raise ValueError("O grau da regra de Newton-Cotes deve ser pelo menos 1.")
+    if grau in _PESOS_NEWTON_COTES:
+        return _PESOS_NEWTON_COTES[grau]
+
+    pesos = []
+    for j in range(grau + 1):
+        # Coeficientes de ℓ_j(t) (do termo constante ao de maior grau)
+        coef = [Fraction(1)]
+        for k in range(grau + 1):
+            if k == j:
+                continue
+            denominador = Fraction(j - k)
+            novo = [Fraction(0)] * (len(coef) + 1)
+            for i, c in enumerate(coef):
+                novo[i] -= c * k / denominador
+                novo[i + 1] += c / denominador
+            coef = novo
+        pesos.append(sum(c * Fraction(grau) ** (i + 1) / (i + 1) for i, c in enumerate(coef)))
+
+    _PESOS_NEWTON_COTES[grau] = tuple(pesos)
+    return _PESOS_NEWTON_COTES[grau]
+
+
+def _soma_bloco_newton_cotes(f, a, h, n, grau, ini, fim):
+    """Σ w_i f(x_i) para os nós de índice ini..fim-1 (sem o fator h)."""
+    pesos = np.array([float(w) for w in pesos_newton_cotes(grau)])
+    # Nós internos que unem dois painéis recebem o peso das duas pontas
+    pesos_internos = pesos[:-1].copy()
+    pesos_internos[0] += pesos[-1]
+
+    indices = np.arange(ini, fim)
+    fx = avaliar_vetorizado(resolver_funcao(f), a + indices * h)
+
+    coeficientes = pesos_internos[indices % grau]
+    if indices[0] == 0:
+        coeficientes[0] = pesos[0]
+    if indices[-1] == n:
+        coeficientes[-1] = pesos[-1]
+    return float(np.dot(coeficientes, fx))
+
+
+def newton_cotes_composta(f, a, b, n, grau, tamanho_bloco=None, executor=None, max_workers=None):
+    """Regra de Newton-Cotes fechada composta de grau `grau` com n subintervalos.
+
+    f é avaliada sobre o array de nós de uma só vez (em blocos de até `tamanho_bloco` nós;
+    por padrão TAMANHO_BLOCO_PADRAO, limitando a memória para n muito grande). n deve ser
+    múltiplo do grau.
+
+    Com executor ('processos', 'threads' ou um Executor), os blocos são distribuídos entre os
+    workers; sem tamanho_bloco, os nós são divididos em paralelo.BLOCOS_PARALELOS blocos. As
+    somas parciais são reduzidas na ordem dos blocos: o resultado não depende do número de
+    workers. Com 'processos', passe f como string (ver paralelo.resolver_funcao).
+    """
+    n = int(n)
+    if n < 1 or n % grau != 0:
+        raise ValueError(f"O número de subintervalos (n) deve ser múltiplo de {grau} para esta regra.")
+    tamanho_bloco = definir_tamanho_bloco(tamanho_bloco, n + 1, executor, TAMANHO_BLOCO_PADRAO)
+
     h = (b - a) / n
-    soma = 0.5 * (f(a) + f(b))
+    tarefas = [(f, a, h, n, grau, ini, min(ini + tamanho_bloco, n + 1))
+               for ini in range(0, n + 1, tamanho_bloco)]
+    with abrir_executor(executor, max_workers) as pool:
+        parciais = mapear_em_ordem(_soma_bloco_newton_cotes, tarefas, pool)
 
-    for i in range(1, n):
-        soma += f(a + i * h)
+    soma = 0.0
+    for parcial in parciais:
+        soma += parcial
+    return float(h * soma)
 
-    integral = h * soma
-    return integral
+
+# ----------------------------------------------------
+# 7.2 REGRA DO TRAPÉZIO
+# ----------------------------------------------------
+
+def regra_trapezio(f, a, b, n, tamanho_bloco=None, executor=None, max_workers=None):
+    """Regra do Trapézio (composta)"""
+    return newton_cotes_composta(f, a, b, n, 1, tamanho_bloco, executor, max_workers)
 
 
 # ----------------------------------------------------
-# 7.3 1/3 DE SIMPSON (Quadratura Gaussiana)
+# 7.3 1/3 DE SIMPSON
 # ----------------------------------------------------
 
-def regra_simpson_1_3(f, a, b, n):
+def regra_simpson_1_3(f, a, b, n, tamanho_bloco=None, executor=None, max_workers=None):
     """Regra de Simpson 1/3 (composta). n deve ser PAR."""
     if n % 2 != 0:
         raise ValueError("O número de subintervalos (n) deve ser PAR para a regra de Simpson 1/3.")
 
-    h = (b - a) / n
-    soma = f(a) + f(b)  # f(x0) + f(xn)
+    # Pesos h/3 · (1, 4, 2, 4, ..., 2, 4, 1)
+    return newton_cotes_composta(f, a, b, n, 2, tamanho_bloco, executor, max_workers)
+
+
+# ----------------------------------------------------
+# 7.4 3/8 DE SIMPSON
+# ----------------------------------------------------
+
+def regra_simpson_3_8(f, a, b, n, tamanho_bloco=None, executor=None, max_workers=None):
+    """Regra de Simpson 3/8 (composta). n deve ser MÚLTIPLO DE 3."""
+    if n % 3 != 0:
+        raise ValueError("O número de subintervalos (n) deve ser múltiplo de 3 para a regra de Simpson 3/8.")
+
+    # Pesos 3h/8 · (1, 3, 3, 2, 3, 3, 2, ..., 3, 3, 1)
+    return newton_cotes_composta(f, a, b, n, 3, tamanho_bloco, executor, max_workers)
+
+
+# ----------------------------------------------------
+# 7.5 REGRA DE BOOLE
+# ----------------------------------------------------
+
+def regra_boole(f, a, b, n, tamanho_bloco=None, executor=None, max_workers=None):
+    """Regra de Boole (composta). n deve ser MÚLTIPLO DE 4."""
+    if n % 4 != 0:
+        raise ValueError("O número de subintervalos (n) deve ser múltiplo de 4 para a regra de Boole.")
+
+    # Pesos 2h/45 · (7, 32, 12, 32, 14, 32, 12, 32, ..., 7)
+    return newton_cotes_composta(f, a, b, n, 4, tamanho_bloco, executor, max_workers)
+
+
+# ----------------------------------------------------
+# 7.6 SIMPSON ADAPTATIVO
+# ----------------------------------------------------
+
+def integracao_simpson_adaptativa(f, a, b, tol, n_inicial=4, max_niveis=50,
+                                  tamanho_bloco=None, executor=None, max_workers=None):
+    """Simpson adaptativo: subdivide só os intervalos cuja estimativa de erro excede a tolerância.
 
-    for i in range(1, n):
-        x_i = a + i * h
-        if i % 2 == 0:
-            soma += 2 * f(x_i)  # Coeficiente 2 para índices pares
-        else:
-            soma += 4 * f(x_i)  # Coeficiente 4 para índices ímpares
+    Processa os intervalos nível a nível (em largura): todos os pontos novos de um nível são
+    avaliados em uma única chamada de f, e cada intervalo reaproveita os 3 valores do pai,
+    custando só 2 avaliações novas. O erro de cada intervalo é estimado por |S2 - S1| / 15,
+    com a tolerância repartida proporcionalmente ao seu comprimento.
+
+    Com executor, os pontos de cada nível são divididos em blocos de até `tamanho_bloco`
+    pontos (por padrão, paralelo.BLOCOS_PARALELOS blocos) e avaliados pelos workers.
+
+    Retorna (integral, relatorio) com 'avaliacoes', 'erro_estimado', 'intervalos' e 'convergiu'.
+    """
+    if tol <= 0:
+        raise ValueError("A tolerância deve ser positiva.")
+    with abrir_executor(executor, max_workers) as pool:
+        return _simpson_adaptativa(f, a, b, tol, max(int(n_inicial), 1), max_niveis, tamanho_bloco, pool)
+
+
+def _simpson_adaptativa(f, a, b, tol, n_inicial, max_niveis, tamanho_bloco, pool):
+    x = np.linspace(a, b, 2 * n_inicial + 1)
+    fx = avaliar_em_blocos(f, x, tamanho_bloco, pool)
+    avaliacoes = x.size
+
+    esq, dir_ = x[:-1:2], x[2::2]
+    f_esq, f_meio, f_dir = fx[:-1:2], fx[1::2], fx[2::2]
+    S = (dir_ - esq) / 6 * (f_esq + 4 * f_meio + f_dir)
+    tol_int = np.full(n_inicial, tol / n_inicial)
+
+    integral = 0.0
+    erro_estimado = 0.0
+    intervalos = 0
+    convergiu = True
+
+    for nivel in range(max_niveis):
+        if esq.size == 0:
+            break
+
+        meio = (esq + dir_) / 2
+        f_quartos = avaliar_em_blocos(f, np.concatenate(((esq + meio) / 2, (meio + dir_) / 2)),
+                                      tamanho_bloco, pool)
+        avaliacoes += f_quartos.size
+        f_q1, f_q3 = np.split(f_quartos, 2)
+
+        S_esq = (meio - esq) / 6 * (f_esq + 4 * f_q1 + f_meio)
+        S_dir = (dir_ - meio) / 6 * (f_meio + 4 * f_q3 + f_dir)
+        diferenca = S_esq + S_dir - S
+
+        aceito = np.abs(diferenca) <= 15 * tol_int
+        if nivel == max_niveis - 1 and not aceito.all():
+            # Profundidade máxima: aceita o que restou, mas sinaliza a não convergência
+            convergiu = False
+            aceito[:] = True
+
+        # Extrapolação de Richardson: S2 + (S2 - S1) / 15
+        integral += np.sum((S_esq + S_dir + diferenca / 15)[aceito])
+        erro_estimado += np.sum(np.abs(diferenca[aceito])) / 15
+        intervalos += np.count_nonzero(aceito)
+
+        r = ~aceito
+        esq, meio, dir_ = esq[r], meio[r], dir_[r]
+        esq, dir_ = np.concatenate((esq, meio)), np.concatenate((meio, dir_))
+        f_esq, f_meio, f_dir = (np.concatenate((f_esq[r], f_meio[r])),
+                                np.concatenate((f_q1[r], f_q3[r])),
+                                np.concatenate((f_meio[r], f_dir[r])))
+        S = np.concatenate((S_esq[r], S_dir[r]))
+        tol_int = np.tile(tol_int[r] / 2, 2)
+
+    relatorio = {
+        'avaliacoes': int(avaliacoes),
+        'erro_estimado': float(erro_estimado),
+        'intervalos': int(intervalos),
+        'convergiu': convergiu,
+    }
+    return float(integral), relatorio
+
+
+# ----------------------------------------------------
+# 7.7 ROMBERG
+# ----------------------------------------------------
+
+def integracao_romberg(f, a, b, tol, max_niveis=20, tamanho_bloco=None, executor=None, max_workers=None):
+    """Integração de Romberg: Trapézio com h sucessivamente dividido por 2 + extrapolação de Richardson.
+
+    Ao dividir h, só os nós novos (os de índice ímpar) são avaliados; os anteriores entram pela
+    estimativa do nível anterior, T(h/2) = T(h)/2 + (h/2)·Σ f(nós novos). Para quando duas
+    diagonais consecutivas da tabela diferem menos que tol.
+
+    Com executor, os nós novos de cada nível são divididos em blocos de até `tamanho_bloco`
+    pontos (por padrão, paralelo.BLOCOS_PARALELOS blocos) e avaliados pelos workers.
+
+    Retorna (integral, relatorio) com 'avaliacoes', 'erro_estimado', 'niveis', 'convergiu' e 'tabela'.
+    """
+    if tol <= 0:
+        raise ValueError("A tolerância deve ser positiva.")
+    with abrir_executor(executor, max_workers) as pool:
+        return _romberg(f, a, b, tol, max_niveis, tamanho_bloco, pool)
+
+
+def _romberg(f, a, b, tol, max_niveis, tamanho_bloco, pool):
+    h = b - a
+    f_a, f_b = avaliar_em_blocos(f, [a, b], tamanho_bloco, pool)
+    avaliacoes = 2
+    R = [[h * (f_a + f_b) / 2]]
+    erro_estimado = float('inf')
+    convergiu = False
+
+    for k in range(1, max_niveis + 1):
+        h /= 2
+        novos = avaliar_em_blocos(f, a + h * np.arange(1, 2 ** k, 2), tamanho_bloco, pool)
+        avaliacoes += novos.size
+
+        linha = [R[-1][0] / 2 + h * np.sum(novos)]
+        for j in range(1, k + 1):
+            linha.append(linha[j - 1] + (linha[j - 1] - R[-1][j - 1]) / (4 ** j - 1))
+        R.append(linha)
+
+        erro_estimado = abs(linha[-1] - R[-2][-1])
+        # Exige ao menos 2 níveis para evitar uma concordância casual nas primeiras estimativas
+        if k >= 2 and erro_estimado <= tol:
+            convergiu = True
+            break
+
+    relatorio = {
+        'avaliacoes': int(avaliacoes),
+        'erro_estimado': float(erro_estimado),
+        'niveis': len(R),
+        'convergiu': convergiu,
+        'tabela': [[float(v) for v in linha] for linha in R],
+    }
+    return float(R[-1][-1]), relatorio
+
+
+# ----------------------------------------------------
+# 7.8 QUADRATURA GAUSSIANA (Gauss-Legendre)
+# ----------------------------------------------------
+
+# Nós e pesos já calculados, indexados pela ordem (número de pontos por painel)
+_NOS_PESOS_GAUSS_LEGENDRE = {}
+
+
+def nos_pesos_gauss_legendre(ordem):
+    """Nós e pesos de Gauss-Legendre com `ordem` pontos em [-1, 1] (exata até grau 2·ordem - 1).
+
+    São calculados uma única vez por ordem e guardados em cache (arrays somente leitura).
+    """
+    ordem = int(ordem)
+    if ordem < 1:
+        raise ValueError("A ordem da quadratura de Gauss-Legendre deve ser pelo menos 1.")
+    if ordem not in _NOS_PESOS_GAUSS_LEGENDRE:
+        nos, pesos = np.polynomial.legendre.leggauss(ordem)
+        nos.flags.writeable = False
+        pesos.flags.writeable = False
+        _NOS_PESOS_GAUSS_LEGENDRE[ordem] = (nos, pesos)
+    return _NOS_PESOS_GAUSS_LEGENDRE[ordem]
+
+
+def _soma_bloco_gauss_legendre(f, a, h, ordem, ini, fim):
+    """Σ w_j f(x_j) sobre os painéis ini..fim-1 (sem o fator h/2)."""
+    nos, pesos = nos_pesos_gauss_legendre(ordem)
+    # Centro de cada painel + nós mapeados de [-1, 1] para o painel
+    centros = a + (np.arange(ini, fim) + 0.5) * h
+    fx = avaliar_vetorizado(resolver_funcao(f), centros[:, None] + (h / 2) * nos)
+    return float(np.sum(fx @ pesos))
+
+
+def regra_gauss_legendre(f, a, b, n=1, ordem=5, tamanho_bloco=None, executor=None, max_workers=None):
+    """Quadratura de Gauss-Legendre composta: n painéis iguais, `ordem` pontos por painel.
+
+    Os nós de todos os painéis são avaliados em uma única chamada de f (em blocos de painéis
+    com até `tamanho_bloco` nós, limitando a memória para n muito grande). Com executor, os
+    blocos são distribuídos entre os workers (ver newton_cotes_composta).
+    """
+    n = int(n)
+    if n < 1:
+        raise ValueError("O número de painéis (n) deve ser pelo menos 1.")
+    ordem = int(ordem)
+    nos_pesos_gauss_legendre(ordem)  # valida a ordem antes de distribuir os blocos
+    if tamanho_bloco is not None:
+        paineis_por_bloco = max(int(tamanho_bloco) // ordem, 1)
+    else:
+        paineis_por_bloco = definir_tamanho_bloco(None, n, executor, max(TAMANHO_BLOCO_PADRAO // ordem, 1))
+
+    h = (b - a) / n
+    tarefas = [(f, a, h, ordem, ini, min(ini + paineis_por_bloco, n))
+               for ini in range(0, n, paineis_por_bloco)]
+    with abrir_executor(executor, max_workers) as pool:
+        parciais = mapear_em_ordem(_soma_bloco_gauss_legendre, tarefas, pool)
 
-    integral = (h / 3) * soma
-    return integral
\ No newline at end of file
+    soma = 0.0
+    for parcial in parciais:
+        soma += parcial
+    return float(h / 2 * soma)
@@ -1,4 +1,6 @@
 import numpy as np
+from metodos.fechados import metodo_bisseccao_lote
+from metodos.lineares import metodo_thomas
 
 
 # ----------------------------------------------------
@@ -10,28 +12,82 @@ def interpolacao_lagrange(x_pontos, y_pontos, x_interpolar):
     if n != len(y_pontos):
         raise ValueError("O número de pontos x e y deve ser o mesmo.")
 
-    x_pontos = np.array(x_pontos, dtype=float)
-    y_pontos = np.array(y_pontos, dtype=float)
-    x_interpolar = float(x_interpolar)
+    # Forma baricêntrica: mesmo polinômio P(x) = Σ y_i L_i(x), com pesos calculados uma vez
+    P_x = InterpoladorBaricentrico(x_pontos, y_pontos)(x_interpolar)
 
-    P_x = 0
+    return P_x if np.ndim(P_x) else float(P_x)
 
-    for i in range(n):
-        # Calcula o polinômio base de Lagrange L_i(x)
-        L_i_x = 1
-        for j in range(n):
-            if i != j:
-                L_i_x *= (x_interpolar - x_pontos[j]) / (x_pontos[i] - x_pontos[j])
 
-        P_x += y_pontos[i] * L_i_x
+# ----------------------------------------------------
+# 5.1.3 LAGRANGE BARICÊNTRICO (Pesos pré-calculados, avaliação vetorizada)
+# ----------------------------------------------------
+
+class InterpoladorBaricentrico:
+    """Polinômio interpolador de Lagrange na forma baricêntrica.
+
+    Os pesos w_i = 1 / Π_(j≠i) (x_i - x_j) são calculados uma vez, em O(n²). Cada ponto é
+    avaliado em O(n):  P(x) = Σ (w_i / (x - x_i)) y_i / Σ (w_i / (x - x_i)).
+    y_pontos pode ter formato (n,) ou (n, k): k séries com os mesmos nós, avaliadas juntas.
+    """
+
+    def __init__(self, x_pontos, y_pontos=None, tamanho_bloco=65536):
+        self.x = np.array(x_pontos, dtype=float).ravel()
+        n = self.x.size
+        if n == 0:
+            raise ValueError("É necessário pelo menos um ponto.")
+        if np.unique(self.x).size != n:
+            raise ValueError("Os pontos x devem ser distintos.")
+
+        # Reescala as diferenças para o intervalo ter comprimento 4 (evita overflow/underflow
+        # no produtório); o fator comum se cancela no quociente da fórmula baricêntrica.
+        escala = 4.0 / (np.ptp(self.x) or 1.0)
+        diferencas = (self.x[:, np.newaxis] - self.x[np.newaxis, :]) * escala
+        np.fill_diagonal(diferencas, 1.0)
+        self.pesos = 1.0 / np.prod(diferencas, axis=1)
+
+        self.y = None if y_pontos is None else self._validar_y(y_pontos)
+        self.tamanho_bloco = max(int(tamanho_bloco), 1)
+
+    def _validar_y(self, y_pontos):
+        y = np.array(y_pontos, dtype=float)
+        if y.shape[0] != self.x.size or y.ndim > 2:
+            raise ValueError("O número de pontos x e y deve ser o mesmo.")
+        return y
+
+    def __call__(self, x_interpolar, y_pontos=None):
+        """Avalia P nos pontos x_interpolar (escalar ou array), em blocos de 'tamanho_bloco' pontos.
 
-    return P_x
+        y_pontos (opcional) substitui os valores guardados, reaproveitando os mesmos pesos.
+        """
+        y = self.y if y_pontos is None else self._validar_y(y_pontos)
+        if y is None:
+            raise ValueError("Informe os valores y_pontos.")
+
+        x_interpolar = np.asarray(x_interpolar, dtype=float)
+        t = x_interpolar.ravel()
+        resultado = np.empty((t.size,) + y.shape[1:])
+
+        for ini in range(0, t.size, self.tamanho_bloco):
+            bloco = t[ini:ini + self.tamanho_bloco]
+            diferencas = bloco[:, np.newaxis] - self.x[np.newaxis, :]
+            exato = diferencas == 0  # x coincide com um nó: P(x_i) = y_i
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                termos = self.pesos / diferencas
+                termos[exato] = 0.0
+                P = (termos @ y) / np.sum(termos, axis=1).reshape((-1,) + (1,) * (y.ndim - 1))
+
+            linhas, nos = np.nonzero(exato)
+            P[linhas] = y[nos]
+            resultado[ini:ini + bloco.size] = P
+
+        return resultado.reshape(x_interpolar.shape + y.shape[1:])
 
 
 # ----------------------------------------------------
 # 5.2.1 TABELA DE DIFERENÇAS DIVIDIDAS FINITAS (NEWTON)
-# Esta função apenas constrói a tabela, a interpolação é complexa para um único módulo
-# Vamos focar na interpolação em si, que é o resultado final.
+# A interpolação usa só os coeficientes (primeira linha da tabela); a tabela
+# completa é montada apenas para visualização no Streamlit.
 # ----------------------------------------------------
 
 def interpolacao_newton_diferencas_divididas(x_pontos, y_pontos, x_interpolar):
@@ -39,32 +95,300 @@ def interpolacao_newton_diferencas_divididas(x_pontos, y_pontos, x_interpolar):
     if n != len(y_pontos):
         raise ValueError("O número de pontos x e y deve ser o mesmo.")
 
-    x = np.array(x_pontos, dtype=float)
-    y = np.array(y_pontos, dtype=float)
+    interpolador = InterpoladorNewton(x_pontos, y_pontos)
+    P_x = interpolador(x_interpolar)
 
-    # Inicializa a tabela de diferenças
-    diff = np.zeros((n, n))
-    diff[:, 0] = y
+    # Retornamos o valor interpolado e a tabela (para visualização no Streamlit)
+    return (P_x if np.ndim(P_x) else float(P_x)), interpolador.tabela()
 
-    # Preenche a tabela
-    for j in range(1, n):
-        for i in range(n - j):
-            diff[i, j] = (diff[i + 1, j - 1] - diff[i, j - 1]) / (x[i + j] - x[i])
 
-    # Polinômio de Newton-Gregory (usa apenas a primeira linha da tabela)
-    P_x = diff[0, 0]  # f[x0]
+# ----------------------------------------------------
+# 5.2.2 NEWTON INCREMENTAL (Pontos adicionados um a um)
+# ----------------------------------------------------
 
-    for j in range(1, n):
-        termo = diff[0, j]
-        for i in range(j):
-            termo *= (x_interpolar - x[i])
-        P_x += termo
+class InterpoladorNewton:
+    """Polinômio de Newton P(x) = c0 + c1 (x - x0) + c2 (x - x0)(x - x1) + ...
+
+    Guarda só os nós, os coeficientes c_j = f[x0..xj] e a última diagonal da tabela
+    (f[xn], f[xn-1, xn], ..., f[x0..xn]): memória O(n) e inserção de um ponto em O(n).
+    """
+
+    def __init__(self, x_pontos=(), y_pontos=()):
+        if len(x_pontos) != len(y_pontos):
+            raise ValueError("O número de pontos x e y deve ser o mesmo.")
+
+        self.x = []
+        self.y = []
+        self.coeficientes = []
+        self._diagonal = []
+        for x_i, y_i in zip(x_pontos, y_pontos):
+            self.adicionar_ponto(x_i, y_i)
+
+    def adicionar_ponto(self, x_novo, y_novo):
+        """Acrescenta o nó (x_novo, y_novo) estendendo apenas a diagonal da tabela."""
+        x_novo = float(x_novo)
+        y_novo = float(y_novo)
+        if x_novo in self.x:
+            raise ValueError("Os pontos x devem ser distintos.")
+
+        n = len(self.x)
+        diagonal = [y_novo]
+        for j in range(1, n + 1):
+            # f[x_(n-j) .. x_n] = (f[x_(n-j+1) .. x_n] - f[x_(n-j) .. x_(n-1)]) / (x_n - x_(n-j))
+            diagonal.append((diagonal[j - 1] - self._diagonal[j - 1]) / (x_novo - self.x[n - j]))
+
+        self.x.append(x_novo)
+        self.y.append(y_novo)
+        self.coeficientes.append(diagonal[-1])
+        self._diagonal = diagonal
+
+    def __len__(self):
+        return len(self.x)
+
+    def __call__(self, x_interpolar):
+        """Avalia P (escalar ou array) pelo esquema de Horner: O(n) por ponto."""
+        if not self.x:
+            raise ValueError("É necessário pelo menos um ponto.")
+
+        t = np.asarray(x_interpolar, dtype=float)
+        P_x = np.full(t.shape, self.coeficientes[-1])
+        for k in range(len(self.x) - 2, -1, -1):
+            P_x = P_x * (t - self.x[k]) + self.coeficientes[k]
+        return P_x
+
+    def tabela(self):
+        """Tabela completa de diferenças divididas (O(n²)), formatada para o Streamlit."""
+        n = len(self.x)
+        x = np.array(self.x)
+
+        # Inicializa a tabela de diferenças
+        diff = np.zeros((n, n))
+        diff[:, 0] = self.y
+
+        # Preenche a tabela
+        for j in range(1, n):
+            diff[:n - j, j] = (diff[1:n - j + 1, j - 1] - diff[:n - j, j - 1]) / (x[j:] - x[:n - j])
+
+        tabela_df = {}
+        for j in range(n):
+            # Apenas as linhas relevantes são mantidas para a coluna
+            coluna = [f"{diff[i, j]:.6f}" if i < n - j else "" for i in range(n)]
+            tabela_df[f'f[x...](ordem {j})'] = coluna
+
+        return tabela_df
+
+
+# ----------------------------------------------------
+# 5.3 INTERPOLAÇÃO INVERSA (Dado y, encontrar x)
+# ----------------------------------------------------
+
+def _lagrange_local(nos_x, nos_y, t):
+    """Lagrange linha a linha: nos_x e nos_y (m, g + 1), t (m,). Cada linha tem seus próprios nós."""
+    g1 = nos_x.shape[1]
+    diagonal = np.eye(g1, dtype=bool)
+
+    fatores = np.repeat((t[:, np.newaxis] - nos_x)[:, np.newaxis, :], g1, axis=1)
+    fatores[:, diagonal] = 1.0
+    denominadores = nos_x[:, :, np.newaxis] - nos_x[:, np.newaxis, :]
+    denominadores[:, diagonal] = 1.0
+
+    L = np.prod(fatores, axis=2) / np.prod(denominadores, axis=2)
+    return np.sum(L * nos_y, axis=1)
+
+
+def _janelas(n, intervalo, grau):
+    """Índices dos grau + 1 nós mais próximos do intervalo [i, i + 1] (centrados quando possível)."""
+    g1 = min(grau + 1, n)
+    inicio = np.clip(intervalo - (g1 - 2) // 2, 0, n - g1)
+    return inicio[:, np.newaxis] + np.arange(g1)
+
+
+class InterpoladorInverso:
+    """Interpolação inversa: encontra x tal que P(x) = y_alvo, para muitos alvos de uma vez.
+
+    Dados monótonos: interpolação inversa direta (x como polinômio de y, nos grau + 1 nós
+    vizinhos). Caso contrário: os dados são divididos em trechos monótonos; em cada trecho,
+    searchsorted localiza o intervalo [x_i, x_i+1] que cruza o alvo e a bissecção em lote
+    resolve P(x) = y_alvo, onde P é o polinômio interpolador local de grau 'grau'.
+    """
+
+    def __init__(self, x_pontos, y_pontos, grau=3, tol=1e-12):
+        x = np.array(x_pontos, dtype=float).ravel()
+        y = np.array(y_pontos, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError("O número de pontos x e y deve ser o mesmo.")
+        if x.size < 2:
+            raise ValueError("São necessários pelo menos 2 pontos.")
+
+        ordem = np.argsort(x)
+        self.x, self.y = x[ordem], y[ordem]
+        if np.any(np.diff(self.x) == 0):
+            raise ValueError("Os pontos x devem ser distintos.")
+
+        self.grau = int(grau)
+        self.tol = tol * (np.ptp(self.x) or 1.0)
+
+        # Trechos monótonos: [inicio, fim] (índices dos nós), separados onde dy troca de sinal
+        sinal = np.sign(np.diff(self.y))
+        quebras = np.nonzero(sinal[1:] != sinal[:-1])[0] + 1
+        limites = np.concatenate(([0], quebras, [self.x.size - 1]))
+        self.trechos = list(zip(limites[:-1], limites[1:]))
+        self.monotono = len(self.trechos) == 1 and np.all(sinal != 0)
+
+        if self.monotono:
+            # Índice para a interpolação direta: nós ordenados por y
+            ordem_y = np.argsort(self.y)
+            self._y_ordenado, self._x_por_y = self.y[ordem_y], self.x[ordem_y]
+
+    def polinomio(self, x_interpolar):
+        """P(x) por partes: polinômio de grau 'grau' nos nós vizinhos do intervalo de cada x."""
+        t = np.asarray(x_interpolar, dtype=float)
+        t_plano = t.ravel()
+        intervalo = np.clip(np.searchsorted(self.x, t_plano, side='right') - 1, 0, self.x.size - 2)
+        nos = _janelas(self.x.size, intervalo, self.grau)
+        return _lagrange_local(self.x[nos], self.y[nos], t_plano).reshape(t.shape)
+
+    def todas_solucoes(self, y_alvo):
+        """Retorna (indices, x): para cada solução, o índice do alvo em y_alvo (achatado) e o x."""
+        alvos = np.asarray(y_alvo, dtype=float).ravel()
+        indices, a, b = [], [], []
+
+        for inicio, fim in self.trechos:
+            y_trecho = self.y[inicio:fim + 1]
+            decrescente = y_trecho[-1] < y_trecho[0]
+            y_ordenado = y_trecho[::-1] if decrescente else y_trecho
+
+            dentro = (alvos >= y_ordenado[0]) & (alvos <= y_ordenado[-1])
+            k = np.nonzero(dentro)[0]
+            pos = np.clip(np.searchsorted(y_ordenado, alvos[k], side='left') - 1, 0, y_ordenado.size - 2)
+            intervalo = inicio + ((fim - inicio - 1 - pos) if decrescente else pos)
+
+            indices.append(k)
+            a.append(intervalo)
+
+        indices = np.concatenate(indices)
+        intervalo = np.concatenate(a)
+        a, b = self.x[intervalo], self.x[intervalo + 1]
+        # tol_f=0: o critério de parada é só self.tol em x; um limiar absoluto em |P(x) - y_alvo|
+        # pararia cedo demais com dados de y pequenos (ex: y ~ 1e-9)
+        raizes, _, convergiu = metodo_bisseccao_lote(self.polinomio, a, b, self.tol, max_iter=200,
+                                                     alvos=alvos[indices], tol_f=0.0)
+
+        # Alvo igual ao y de um nó: a solução é o próprio nó (perto de um extremo local
+        # P(x) - y_alvo fica plano e a bissecção só chegaria nele a menos de tol)
+        no_esquerdo = alvos[indices] == self.y[intervalo]
+        no_direito = alvos[indices] == self.y[intervalo + 1]
+        raizes[no_esquerdo] = a[no_esquerdo]
+        raizes[no_direito] = b[no_direito]
+        convergiu |= no_esquerdo | no_direito
+        indices, raizes = indices[convergiu], raizes[convergiu]
+
+        # Um alvo igual ao y de um nó de virada aparece nos dois trechos vizinhos
+        ordem = np.lexsort((raizes, indices))
+        indices, raizes = indices[ordem], raizes[ordem]
+        repetida = np.zeros(raizes.size, dtype=bool)
+        repetida[1:] = (indices[1:] == indices[:-1]) & (np.diff(raizes) <= self.tol)
+        return indices[~repetida], raizes[~repetida]
+
+    def __call__(self, y_alvo):
+        """Um x por alvo (NaN fora do intervalo dos dados). Sem monotonia, retorna o menor x."""
+        alvos = np.asarray(y_alvo, dtype=float)
+        t = alvos.ravel()
+
+        if self.monotono:
+            n = self.x.size
+            intervalo = np.clip(np.searchsorted(self._y_ordenado, t, side='right') - 1, 0, n - 2)
+            nos = _janelas(n, intervalo, self.grau)
+            x = _lagrange_local(self._y_ordenado[nos], self._x_por_y[nos], t)
+            x[(t < self._y_ordenado[0]) | (t > self._y_ordenado[-1])] = np.nan
+        else:
+            indices, raizes = self.todas_solucoes(t)
+            x = np.full(t.size, np.nan)
+            # As soluções vêm ordenadas por (alvo, x): a primeira de cada alvo é a menor
+            primeira = np.ones(indices.size, dtype=bool)
+            primeira[1:] = indices[1:] != indices[:-1]
+            x[indices[primeira]] = raizes[primeira]
+
+        return x.reshape(alvos.shape)
+
+
+def interpolacao_inversa(x_pontos, y_pontos, y_alvo, grau=3):
+    """Valor de x tal que P(x) = y_alvo (escalar ou array). Ver InterpoladorInverso."""
+    x = InterpoladorInverso(x_pontos, y_pontos, grau)(y_alvo)
+    return x if np.ndim(x) else float(x)
+
+
+# ----------------------------------------------------
+# 5.4 SPLINE CÚBICO (Natural e Fixado)
+# ----------------------------------------------------
+
+class SplineCubico:
+    """Spline cúbico interpolador: um polinômio de grau 3 por intervalo, com S, S' e S'' contínuas.
+
+    As segundas derivadas M_i nos nós saem de um sistema tridiagonal resolvido por Thomas
+    (construção em O(n)). A avaliação localiza o intervalo de cada ponto com searchsorted
+    (O(log n) por ponto) e usa Horner no polinômio do intervalo.
+
+    contorno="natural": S''(x0) = S''(xn) = 0.
+    contorno="fixado": S'(x0) = derivadas[0] e S'(xn) = derivadas[1].
+    """
+
+    def __init__(self, x_pontos, y_pontos, contorno="natural", derivadas=(0.0, 0.0)):
+        x = np.array(x_pontos, dtype=float).ravel()
+        y = np.array(y_pontos, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError("O número de pontos x e y deve ser o mesmo.")
+        if x.size < 2:
+            raise ValueError("São necessários pelo menos 2 pontos.")
+        if contorno not in ("natural", "fixado"):
+            raise ValueError("Condição de contorno inválida. Use 'natural' ou 'fixado'.")
+
+        ordem = np.argsort(x)
+        x, y = x[ordem], y[ordem]
+        h = np.diff(x)
+        if np.any(h == 0):
+            raise ValueError("Os pontos x devem ser distintos.")
+
+        # Sistema tridiagonal para M_0..M_n
+        inclinacao = np.diff(y) / h
+        n = x.size
+        inferior = np.zeros(n - 1)
+        diagonal = np.ones(n)
+        superior = np.zeros(n - 1)
+        d = np.zeros(n)
+
+        inferior[:-1] = h[:-1]
+        diagonal[1:-1] = 2 * (h[:-1] + h[1:])
+        superior[1:] = h[1:]
+        d[1:-1] = 6 * np.diff(inclinacao)
+
+        if contorno == "fixado":
+            diagonal[0], superior[0] = 2 * h[0], h[0]
+            d[0] = 6 * (inclinacao[0] - derivadas[0])
+            inferior[-1], diagonal[-1] = h[-1], 2 * h[-1]
+            d[-1] = 6 * (derivadas[1] - inclinacao[-1])
+
+        M = metodo_thomas(inferior, diagonal, superior, d)
+
+        # Coeficientes de S_i(x) = a + b (x - x_i) + c (x - x_i)² + d (x - x_i)³
+        self.x = x
+        self.coeficientes = np.column_stack((
+            y[:-1],
+            inclinacao - h * (2 * M[:-1] + M[1:]) / 6,
+            M[:-1] / 2,
+            np.diff(M) / (6 * h),
+        ))
+
+    def __call__(self, x_interpolar):
+        """Avalia o spline (escalar ou array). Fora de [x0, xn], estende o polinômio da ponta."""
+        t = np.asarray(x_interpolar, dtype=float)
+        intervalo = np.clip(np.searchsorted(self.x, t, side='right') - 1, 0, self.x.size - 2)
+        a, b, c, d = np.moveaxis(self.coeficientes[intervalo], -1, 0)
+        dx = t - self.x[intervalo]
+        return a + dx * (b + dx * (c + dx * d))
 
-    # Retornamos o valor interpolado e a tabela (para visualização no Streamlit)
-    tabela_df = {}
-    for j in range(n):
-        # Apenas as linhas relevantes são mantidas para a coluna
-        coluna = [f"{diff[i, j]:.6f}" if i < n - j else "" for i in range(n)]
-        tabela_df[f'f[x...](ordem {j})'] = coluna
 
-    return P_x, tabela_df
\ No newline at end of file
+def interpolacao_spline_cubico(x_pontos, y_pontos, x_interpolar, contorno="natural", derivadas=(0.0, 0.0)):
+    """Valor do spline cúbico em x_interpolar (escalar ou array). Ver SplineCubico."""
+    S_x = SplineCubico(x_pontos, y_pontos, contorno, derivadas)(x_interpolar)
+    return S_x if np.ndim(S_x) else float(S_x)
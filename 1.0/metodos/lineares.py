@@ -1,36 +1,542 @@
+import os
+import tempfile
 import numpy as np
-from metodos.utils import validar_sistema_linear  # Requer a função de validação
+from metodos.utils import validar_sistema_linear, validar_matriz_quadrada  # Requer a função de validação
+
+
+class MatrizSingular(Exception):
+    """Pivô nulo durante a eliminação: a matriz é singular (ou numericamente singular)."""
 
 
 # ----------------------------------------------------
 # 4.1 MÉTODO DA ELIMINAÇÃO DE GAUSS
 # ----------------------------------------------------
 
-def metodo_eliminacao_gauss(A_input, b_input):
+def metodo_eliminacao_gauss(A_input, b_input, banda=None):
+    """Resolve A x = b. Retorna (x, M), M = matriz aumentada [A | b] após o escalonamento.
+
+    banda: None (eliminação densa), "auto" (detecta se A é de banda) ou (l, u), as larguras
+    de banda inferior e superior. No caminho de banda, M é a matriz de banda compacta escalonada.
+    """
+    A, b, n = validar_sistema_linear(A_input, b_input)
+
+    if banda is not None:
+        l_real, u_real = largura_banda(A)
+        if banda == "auto":
+            l, u = l_real, u_real
+        else:
+            l, u = banda
+            # Uma banda declarada mais estreita que a de A ignoraria elementos (x errado, sem erro)
+            if l < l_real or u < u_real:
+                raise ValueError(f"A banda informada (l={l}, u={u}) é mais estreita que a de A "
+                                 f"(l={l_real}, u={u_real}).")
+        # Só compensa quando a banda é bem menor que a matriz
+        if banda != "auto" or 2 * l + u + 1 <= n // 4:
+            return _resolver_sistema_banda(A, b, l, u)
+
+    # Etapa 1: Eliminação (Forma Escalonada), guardada como fatoração PA = LU
+    lu = fatoracao_lu(A)
+
+    # Aplica em b as mesmas trocas e multiplicadores usados em A
+    y = lu._substituicao_progressiva(b[lu.perm])
+
+    # Etapa 2: Substituição Retroativa
+    x = lu._substituicao_retroativa(y)
+
+    # Matriz Aumentada [U | y] (forma escalonada de [A | b])
+    M = np.hstack((np.triu(lu.LU), y.reshape(n, 1)))
+
+    return x, M
+
+
+# ----------------------------------------------------
+# 4.2 FATORAÇÃO LU (Fatora uma vez, resolve vários b)
+# ----------------------------------------------------
+
+class FatoracaoLU:
+    """Fatoração PA = LU com pivoteamento parcial, guardada de forma compacta.
+
+    LU: matriz n x n com U no triângulo superior e os multiplicadores de L abaixo
+    da diagonal (a diagonal de L, toda igual a 1, não é guardada).
+    perm: ordem das linhas de A após as trocas (A[perm] = L @ U).
+    """
+
+    def __init__(self, LU, perm, trocas, tamanho_bloco=64):
+        self.LU = LU
+        self.perm = perm
+        self.trocas = trocas
+        self.n = LU.shape[0]
+        self.tamanho_bloco = tamanho_bloco
+
+    def resolver(self, b):
+        """Resolve A x = b em O(n²). b pode ser um vetor (n,) ou um bloco de colunas (n, m)."""
+        b = np.asarray(b, dtype=self.LU.dtype)
+        if b.ndim not in (1, 2) or b.shape[0] != self.n:
+            raise ValueError("O vetor b deve ter n elementos (ou ser uma matriz n x m).")
+
+        y = self._substituicao_progressiva(b[self.perm])
+        return self._substituicao_retroativa(y)
+
+    def _substituicao_progressiva(self, c):
+        """Resolve L y = c (L triangular inferior com diagonal unitária), em blocos.
+
+        Fora do bloco diagonal, um produto matriz-vetor; dentro dele, substituição linha a linha
+        (produtos escalares com os y já calculados). O(n²) por b, sem inverter blocos.
+        """
+        LU, n, nb = self.LU, self.n, self.tamanho_bloco
+        y = np.array(c, dtype=LU.dtype)
+        for k in range(0, n, nb):
+            k_fim = min(k + nb, n)
+            if k > 0:
+                y[k:k_fim] -= LU[k:k_fim, :k] @ y[:k]
+            for i in range(k + 1, k_fim):
+                y[i] -= LU[i, k:i] @ y[k:i]
+        return y
+
+    def _substituicao_retroativa(self, y):
+        """Resolve U x = y (U triangular superior), em blocos de baixo para cima."""
+        LU, n, nb = self.LU, self.n, self.tamanho_bloco
+        x = np.array(y, dtype=LU.dtype)
+        # Mesmos blocos da substituição progressiva, percorridos de baixo para cima
+        for k in reversed(range(0, n, nb)):
+            k_fim = min(k + nb, n)
+            if k_fim < n:
+                x[k:k_fim] -= LU[k:k_fim, k_fim:] @ x[k_fim:]
+            for i in range(k_fim - 1, k - 1, -1):
+                if i + 1 < k_fim:
+                    x[i] -= LU[i, i + 1:k_fim] @ x[i + 1:k_fim]
+                x[i] /= LU[i, i]
+        return x
+
+    def determinante(self):
+        """det(A) = (-1)^trocas * produto da diagonal de U."""
+        sinal = -1.0 if self.trocas % 2 else 1.0
+        return sinal * np.prod(np.diag(self.LU))
+
+    def inversa(self):
+        """A⁻¹, resolvendo A X = I com os mesmos fatores."""
+        return self.resolver(np.eye(self.n, dtype=self.LU.dtype))
+
+
+def _fatorar_painel(LU, k, k_fim, perm):
+    """Fatora as colunas k:k_fim (painel) com pivoteamento parcial, via atualizações de posto 1.
+
+    As trocas de linha são aplicadas na linha inteira; a atualização fica restrita ao painel.
+    Retorna o número de trocas feitas.
+    """
+    trocas = 0
+    for i in range(k, k_fim):
+        pivot_row = i + np.argmax(np.abs(LU[i:, i]))
+        if LU[pivot_row, i] == 0:
+            raise MatrizSingular("Matriz Singular ou Mal Condicionada (Divisão por zero no pivô).")
+
+        if pivot_row != i:
+            LU[[i, pivot_row]] = LU[[pivot_row, i]]
+            perm[[i, pivot_row]] = perm[[pivot_row, i]]
+            trocas += 1
+
+        # Multiplicadores de toda a coluna de uma vez + atualização de posto 1 do restante do painel
+        LU[i + 1:, i] /= LU[i, i]
+        LU[i + 1:, i + 1:k_fim] -= np.outer(LU[i + 1:, i], LU[i, i + 1:k_fim])
+    return trocas
+
+
+def _triangular_inferior_unitaria(bloco):
+    """L de um bloco diagonal da forma compacta: multiplicadores abaixo da diagonal e 1 na diagonal."""
+    return np.tril(bloco, -1) + np.eye(bloco.shape[0], dtype=bloco.dtype)
+
+
+def fatoracao_lu(A_input, tamanho_bloco=64, sobrescrever=False):
+    """Fatora A (n x n) em PA = LU com pivoteamento parcial e retorna um objeto FatoracaoLU.
+
+    Eliminação em blocos: cada painel de 'tamanho_bloco' colunas é fatorado com atualizações
+    de posto 1 e o restante da matriz recebe uma única atualização de posto k (produto de
+    matrizes). Com sobrescrever=True e A já em float, a fatoração é feita no próprio A.
+    """
+    if sobrescrever and isinstance(A_input, np.ndarray) and np.issubdtype(A_input.dtype, np.floating):
+        LU = A_input
+        if LU.ndim != 2 or LU.shape[0] != LU.shape[1]:
+            raise ValueError("A matriz A deve ser quadrada (n x n).")
+        n = LU.shape[0]
+    else:
+        A, n = validar_matriz_quadrada(A_input)
+        LU = A  # validar_matriz_quadrada já devolve uma cópia
+
+    perm = np.arange(n)
+    trocas = 0
+    tamanho_bloco = max(int(tamanho_bloco), 1)
+
+    for k in range(0, n, tamanho_bloco):
+        k_fim = min(k + tamanho_bloco, n)
+
+        # Etapa 1: painel [k:n, k:k_fim]
+        trocas += _fatorar_painel(LU, k, k_fim, perm)
+
+        if k_fim < n:
+            # Etapa 2: linhas do bloco de U à direita do painel (U12 = L11⁻¹ A12)
+            LU[k:k_fim, k_fim:] = np.linalg.solve(
+                _triangular_inferior_unitaria(LU[k:k_fim, k:k_fim]), LU[k:k_fim, k_fim:])
+
+            # Etapa 3: atualização de posto k do restante (A22 -= L21 @ U12)
+            LU[k_fim:, k_fim:] -= LU[k_fim:, k:k_fim] @ LU[k:k_fim, k_fim:]
+
+    return FatoracaoLU(LU, perm, trocas, tamanho_bloco)
+
+
+# ----------------------------------------------------
+# 4.2.1 PRECISÃO MISTA (Fatoração em float32 + refinamento iterativo em float64)
+# ----------------------------------------------------
+
+def metodo_eliminacao_gauss_precisao_mista(A_input, b_input, max_refinamentos=10):
+    """Fatora A em float32 (metade da memória e da banda) e recupera a precisão de float64
+    corrigindo x com o resíduo r = b - A x calculado em float64.
+
+    Se o refinamento estagnar (A mal condicionada) ou a fatoração em float32 falhar,
+    refaz tudo em float64. Retorna (x, relatorio) com 'precisao' ("mista" ou "float64"),
+    'refinamentos', 'fallback' e 'residuo' (||b - Ax|| / ||b||).
+    """
     A, b, n = validar_sistema_linear(A_input, b_input)
 
-    # Matriz Aumentada [A | b]
-    M = np.hstack((A, b.reshape(n, 1)))
+    # Critério de parada do LAPACK (dsgesv): ||r|| <= ||x|| * ||A|| * eps * sqrt(n)
+    limite = np.linalg.norm(A, np.inf) * np.finfo(np.float64).eps * np.sqrt(n)
+    refinamentos = 0
+    convergiu = False
+
+    try:
+        lu = fatoracao_lu(A.astype(np.float32), sobrescrever=True)
+        x = lu.resolver(b).astype(np.float64)
+        norma_dx_ant = np.inf
+
+        while np.all(np.isfinite(x)):
+            r = b - A @ x
+            if np.linalg.norm(r, np.inf) <= np.linalg.norm(x, np.inf) * limite:
+                convergiu = True
+                break
+            if refinamentos == max_refinamentos:
+                break
+
+            dx = lu.resolver(r).astype(np.float64)
+            x += dx
+            refinamentos += 1
+
+            # Estagnou: a correção não diminuiu pelo menos pela metade
+            norma_dx = np.linalg.norm(dx, np.inf)
+            if norma_dx > 0.5 * norma_dx_ant:
+                break
+            norma_dx_ant = norma_dx
+    except (MatrizSingular, np.linalg.LinAlgError):
+        pass  # Pivô nulo em float32: segue para float64
+
+    if not convergiu:
+        x = fatoracao_lu(A).resolver(b)
+
+    relatorio = {
+        'precisao': "mista" if convergiu else "float64",
+        'refinamentos': refinamentos,
+        'fallback': not convergiu,
+        'residuo': float(np.linalg.norm(b - A @ x) / (np.linalg.norm(b) or 1.0)),
+    }
+    return x, relatorio
+
+
+# ----------------------------------------------------
+# 4.3 ELIMINAÇÃO DE GAUSS EM LOTE (Vários sistemas pequenos de uma vez)
+# ----------------------------------------------------
+
+def metodo_eliminacao_gauss_lote(A_input, b_input):
+    """Resolve k sistemas independentes A[i] x[i] = b[i] ao mesmo tempo.
+
+    A: (k, n, n); b: (k, n) ou (k, n, m). O pivoteamento parcial é feito em todos os
+    sistemas em paralelo (broadcasting). Retorna (x, singular): sistemas singulares não
+    interrompem o lote; ficam com x = NaN e singular[i] = True.
+    """
+    A = np.array(A_input, dtype=float)
+    B = np.array(b_input, dtype=float)
+
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("A deve ter formato (k, n, n): k matrizes quadradas.")
+    k, n, _ = A.shape
+    vetor = B.ndim == 2
+    if vetor:
+        B = B[:, :, np.newaxis]
+    if B.ndim != 3 or B.shape[:2] != (k, n):
+        raise ValueError("b deve ter formato (k, n) ou (k, n, m).")
 
-    # Etapa 1: Eliminação (Forma Escalonada)
+    singular = np.zeros(k, dtype=bool)
+    sistemas = np.arange(k)
+
+    # Etapa 1: Eliminação, coluna a coluna, em todos os sistemas
     for i in range(n):
+        pivot_row = i + np.argmax(np.abs(A[:, i:, i]), axis=1)
 
-        # Pivoteamento Parcial (encontra o maior elemento na coluna i abaixo da linha i)
-        pivot_row = i + np.argmax(np.abs(M[i:, i]))
-        if M[pivot_row, i] == 0:
-            raise Exception("Matriz Singular ou Mal Condicionada (Divisão por zero no pivô).")
+        # Troca as linhas i e pivot_row de cada sistema
+        linha_i, linha_p = A[sistemas, i].copy(), A[sistemas, pivot_row].copy()
+        A[sistemas, i], A[sistemas, pivot_row] = linha_p, linha_i
+        linha_i, linha_p = B[sistemas, i].copy(), B[sistemas, pivot_row].copy()
+        B[sistemas, i], B[sistemas, pivot_row] = linha_p, linha_i
 
-        # Troca as linhas (pivoteamento)
-        M[[i, pivot_row]] = M[[pivot_row, i]]
+        pivo = A[:, i, i]
+        nulo = pivo == 0
+        singular |= nulo
+        pivo = np.where(nulo, 1.0, pivo)  # Evita a divisão por zero; o sistema já está marcado
 
-        # Eliminação
-        for j in range(i + 1, n):
-            fator = M[j, i] / M[i, i]
-            M[j, i:] = M[j, i:] - fator * M[i, i:]
+        fatores = A[:, i + 1:, i] / pivo[:, np.newaxis]
+        A[:, i + 1:, i:] -= fatores[:, :, np.newaxis] * A[:, np.newaxis, i, i:]
+        B[:, i + 1:] -= fatores[:, :, np.newaxis] * B[:, np.newaxis, i]
 
     # Etapa 2: Substituição Retroativa
-    x = np.zeros(n)
+    diagonal = np.where(singular[:, np.newaxis], 1.0, np.diagonal(A, axis1=1, axis2=2))
+    x = np.zeros_like(B)
     for i in range(n - 1, -1, -1):
-        x[i] = (M[i, n] - np.dot(M[i, i + 1:n], x[i + 1:n])) / M[i, i]
+        soma = np.einsum('kj,kjm->km', A[:, i, i + 1:], x[:, i + 1:])
+        x[:, i] = (B[:, i] - soma) / diagonal[:, i, np.newaxis]
+    x[singular] = np.nan
+
+    return (x[:, :, 0] if vetor else x), singular
+
+
+# ----------------------------------------------------
+# 4.11 ELIMINAÇÃO DE GAUSS FORA DA MEMÓRIA (np.memmap)
+# ----------------------------------------------------
+
+def _abrir_matriz_em_disco(A_input, b, diretorio_trabalho, sobrescrever, tamanho_bloco):
+    """Retorna (M, caminho_temporario): M é um memmap de trabalho que pode ser alterado.
+
+    Sem sobrescrever, a matriz original é copiada bloco a bloco para um arquivo temporário.
+    """
+    if isinstance(A_input, (str, os.PathLike)):
+        A = np.load(A_input, mmap_mode='r+' if sobrescrever else 'r')
+    else:
+        A = A_input
+
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("A matriz A deve ser quadrada (n x n).")
+    if b.ndim != 1 or b.size != A.shape[0]:
+        raise ValueError("O vetor b deve ter n elementos.")
+
+    if sobrescrever and isinstance(A, np.memmap) and A.dtype == np.float64 and A.flags.writeable:
+        return A, None
+
+    descritor, caminho = tempfile.mkstemp(suffix='.dat', dir=diretorio_trabalho)
+    os.close(descritor)
+    n = A.shape[0]
+    M = None
+    try:
+        M = np.memmap(caminho, dtype=np.float64, mode='w+', shape=(n, n))
+        for i in range(0, n, tamanho_bloco):
+            M[i:i + tamanho_bloco] = A[i:i + tamanho_bloco]
+    except BaseException:
+        # Disco cheio, conversão de tipo inválida etc.: não deixa o arquivo temporário para trás
+        del M
+        os.remove(caminho)
+        raise
+    return M, caminho
+
+
+def metodo_eliminacao_gauss_fora_memoria(A_input, b_input, tamanho_bloco=256,
+                                         diretorio_trabalho=None, sobrescrever=False):
+    """Eliminação de Gauss para matrizes maiores que a memória RAM.
+
+    A pode ser um np.memmap ou o caminho de um arquivo .npy (aberto com mmap). A eliminação
+    é feita painel a painel: só um painel de 'tamanho_bloco' colunas e um bloco de colunas à
+    direita dele ficam na memória (2 * n * tamanho_bloco valores). b e x ficam na RAM.
+
+    Sem sobrescrever, A é copiada para um arquivo temporário em 'diretorio_trabalho'
+    (removido no final); com sobrescrever=True, o próprio arquivo é usado (e alterado) na eliminação.
+    """
+    b = np.array(b_input, dtype=float)
+    tamanho_bloco = max(int(tamanho_bloco), 1)
+    M, caminho_temporario = _abrir_matriz_em_disco(A_input, b, diretorio_trabalho, sobrescrever, tamanho_bloco)
+    n = M.shape[0]
+
+    try:
+        # Etapa 1: Eliminação, um painel de colunas por vez
+        for k in range(0, n, tamanho_bloco):
+            k_fim = min(k + tamanho_bloco, n)
+            nb = k_fim - k
+
+            painel = np.array(M[k:, k:k_fim])
+            trocas = []
+            for j in range(nb):
+                pivot_row = j + np.argmax(np.abs(painel[j:, j]))
+                if painel[pivot_row, j] == 0:
+                    raise MatrizSingular("Matriz Singular ou Mal Condicionada (Divisão por zero no pivô).")
+
+                trocas.append(pivot_row)
+                if pivot_row != j:
+                    painel[[j, pivot_row]] = painel[[pivot_row, j]]
+                    b[[k + j, k + pivot_row]] = b[[k + pivot_row, k + j]]
+
+                painel[j + 1:, j] /= painel[j, j]
+                painel[j + 1:, j + 1:] -= np.outer(painel[j + 1:, j], painel[j, j + 1:])
+                # O vetor b recebe a mesma eliminação (como na matriz aumentada)
+                b[k + j + 1:] -= painel[j + 1:, j] * b[k + j]
+            M[k:, k:k_fim] = painel
+
+            # Colunas à direita do painel: trocas, U12 = L11⁻¹ A12 e A22 -= L21 @ U12
+            L11 = _triangular_inferior_unitaria(painel[:nb])
+            L21 = painel[nb:]
+            for c in range(k_fim, n, tamanho_bloco):
+                c_fim = min(c + tamanho_bloco, n)
+                bloco = np.array(M[k:, c:c_fim])
+                for j, pivot_row in enumerate(trocas):
+                    if pivot_row != j:
+                        bloco[[j, pivot_row]] = bloco[[pivot_row, j]]
+                bloco[:nb] = np.linalg.solve(L11, bloco[:nb])
+                bloco[nb:] -= L21 @ bloco[:nb]
+                M[k:, c:c_fim] = bloco
+            del painel, L21
+
+        # Etapa 2: Substituição Retroativa, lendo U em blocos de linhas (de baixo para cima)
+        x = np.zeros(n)
+        for k_fim in range(n, 0, -tamanho_bloco):
+            k = max(k_fim - tamanho_bloco, 0)
+            linhas = np.array(M[k:k_fim, k:])
+            nb = k_fim - k
+            rhs = b[k:k_fim] - linhas[:, nb:] @ x[k_fim:]
+            x[k:k_fim] = np.linalg.solve(np.triu(linhas[:, :nb]), rhs)
+
+        if isinstance(M, np.memmap):
+            M.flush()
+    finally:
+        if caminho_temporario is not None:
+            del M
+            os.remove(caminho_temporario)
+
+    return x
+
+
+# ----------------------------------------------------
+# 4.12 SISTEMAS TRIDIAGONAIS E DE BANDA
+# ----------------------------------------------------
+
+def largura_banda(A):
+    """Retorna (l, u): maior distância de um elemento não nulo abaixo e acima da diagonal.
+
+    Percorre as diagonais de fora para dentro e para na primeira com algum elemento não nulo:
+    uma matriz densa custa O(n), e diagonais nulas dentro da banda (ex: Poisson 2D) não a encurtam.
+    """
+    A = np.asarray(A)
+    n = min(A.shape)
+    l = next((k for k in range(n - 1, 0, -1) if np.any(np.diagonal(A, -k))), 0)
+    u = next((k for k in range(n - 1, 0, -1) if np.any(np.diagonal(A, k))), 0)
+    return l, u
+
+
+def para_armazenamento_banda(A, l, u):
+    """Converte A densa para o armazenamento compacto de banda, com l linhas extras para o pivoteamento.
+
+    ab tem formato (2l + u + 1, n) e A[i, j] fica em ab[l + u + i - j, j].
+    """
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    ab = np.zeros((2 * l + u + 1, n))
+    for d in range(-u, l + 1):  # d = i - j
+        j = np.arange(max(0, -d), min(n, n - d))
+        ab[l + u + d, j] = A[j + d, j]
+    return ab
+
+
+def metodo_thomas(inferior, diagonal, superior, d):
+    """Algoritmo de Thomas para sistemas tridiagonais, em O(n) tempo e memória.
+
+    inferior[i] = A[i+1, i], diagonal[i] = A[i, i], superior[i] = A[i, i+1] (n - 1, n, n - 1 elementos).
+    Sem pivoteamento: indicado para matrizes diagonalmente dominantes (ex: splines).
+    """
+    return _eliminacao_thomas(inferior, diagonal, superior, d)[0]
+
+
+def _eliminacao_thomas(inferior, diagonal, superior, d):
+    """Thomas, retornando também a diagonal após a eliminação: (x, diagonal_escalonada)."""
+    a = np.asarray(inferior, dtype=float)
+    b = np.array(diagonal, dtype=float)
+    c = np.asarray(superior, dtype=float)
+    d = np.array(d, dtype=float)
+    n = b.size
+    if a.size != n - 1 or c.size != n - 1 or d.shape[0] != n:
+        raise ValueError("Diagonais incompatíveis: esperadas n - 1, n e n - 1 posições, e d com n elementos.")
+
+    # Eliminação (ida)
+    for i in range(1, n):
+        if b[i - 1] == 0:
+            raise MatrizSingular("Matriz Singular ou Mal Condicionada (Divisão por zero no pivô).")
+        fator = a[i - 1] / b[i - 1]
+        b[i] -= fator * c[i - 1]
+        d[i] -= fator * d[i - 1]
+    if b[n - 1] == 0:
+        raise MatrizSingular("Matriz Singular ou Mal Condicionada (Divisão por zero no pivô).")
+
+    # Substituição Retroativa (volta)
+    x = d
+    x[n - 1] /= b[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = (x[i] - c[i] * x[i + 1]) / b[i]
+    return x, b
+
+
+def metodo_eliminacao_gauss_banda(ab_input, l, u, b_input):
+    """Eliminação de Gauss com pivoteamento parcial sobre o armazenamento compacto de banda.
+
+    ab_input: (2l + u + 1, n), como em para_armazenamento_banda. Custa O(n·l·(l + u)) em tempo
+    e O(n·(2l + u)) em memória. Retorna (x, ab) com ab já escalonada.
+    """
+    ab = np.array(ab_input, dtype=float)
+    b = np.array(b_input, dtype=float)
+    n = ab.shape[1]
+    D = l + u  # Linha de ab que guarda a diagonal principal
+    if ab.shape[0] != 2 * l + u + 1 or b.shape[0] != n:
+        raise ValueError("Dimensões incompatíveis: ab deve ter 2l + u + 1 linhas e b, n elementos.")
+
+    # Guardamos ab transposta (n, 2l + u + 1): assim a janela ativa de cada passo (linhas k..k+l,
+    # colunas k..k+l+u, já que U ganha até l + u diagonais) é uma visão com passos fixos na memória.
+    abT = np.ascontiguousarray(ab.T)
+    plano = abT.reshape(-1)
+    w = abT.shape[1]
+    passo_linha, passo_coluna = plano.itemsize, plano.itemsize * (w - 1)
+
+    def janela(k, n_linhas, n_colunas):
+        return np.ndarray((n_linhas, n_colunas), dtype=plano.dtype, buffer=plano,
+                          offset=(k * w + D) * plano.itemsize, strides=(passo_linha, passo_coluna))
+
+    # Etapa 1: Eliminação
+    for k in range(n):
+        n_linhas = min(l + 1, n - k)
+        W = janela(k, n_linhas, min(l + u + 1, n - k))
+
+        pivot_row = np.argmax(np.abs(W[:, 0]))
+        if W[pivot_row, 0] == 0:
+            raise MatrizSingular("Matriz Singular ou Mal Condicionada (Divisão por zero no pivô).")
+        if pivot_row != 0:
+            W[[0, pivot_row]] = W[[pivot_row, 0]]
+            b[[k, k + pivot_row]] = b[[k + pivot_row, k]]
+
+        fatores = W[1:, 0] / W[0, 0]
+        W[1:, 1:] -= fatores[:, np.newaxis] * W[0, 1:]
+        W[1:, 0] = 0.0
+        b[k + 1:k + n_linhas] -= fatores * b[k]
+
+    # Etapa 2: Substituição Retroativa (U tem a diagonal e l + u diagonais acima)
+    x = np.zeros(n)
+    for k in range(n - 1, -1, -1):
+        fim = min(k + l + u + 1, n)
+        linha_u = janela(k, 1, fim - k)[0]
+        x[k] = (b[k] - np.dot(linha_u[1:], x[k + 1:fim])) / linha_u[0]
+    return x, np.ascontiguousarray(abT.T)
+
+
+def _resolver_sistema_banda(A, b, l, u):
+    """Caminho de banda de metodo_eliminacao_gauss: Thomas se possível, senão LU de banda."""
+    if l <= 1 and u <= 1 and A.shape[0] > 1:
+        inferior, diagonal, superior = np.diag(A, -1), np.diag(A), np.diag(A, 1)
+        vizinhos = np.abs(np.concatenate(([0.0], inferior))) + np.abs(np.concatenate((superior, [0.0])))
+        if np.all(np.abs(diagonal) >= vizinhos):
+            x, diagonal_escalonada = _eliminacao_thomas(inferior, diagonal, superior, b)
+            # Mesmo formato do caminho de LU de banda: (2l + u + 1, n), já escalonada (sem trocas,
+            # as linhas de preenchimento e a subdiagonal eliminada ficam zeradas)
+            ab = np.zeros((2 * l + u + 1, A.shape[0]))
+            ab[l + u] = diagonal_escalonada
+            if u == 1:
+                ab[l + u - 1, 1:] = superior
+            return x, ab
 
-    return x, M
\ No newline at end of file
+    return metodo_eliminacao_gauss_banda(para_armazenamento_banda(A, l, u), l, u, b)
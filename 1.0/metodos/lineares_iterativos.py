@@ -0,0 +1,184 @@
+import time
+import numpy as np
+from metodos.utils import validar_matriz_quadrada
+
+
+# ----------------------------------------------------
+# 4.4 MATRIZ ESPARSA (Formato CSR)
+# ----------------------------------------------------
+
+class MatrizCSR:
+    """Matriz esparsa no formato CSR (Compressed Sparse Row), guardada em três arrays.
+
+    dados: valores não nulos, linha por linha; indices: coluna de cada valor;
+    indptr: os valores da linha i estão em dados[indptr[i]:indptr[i + 1]].
+    """
+
+    def __init__(self, dados, indices, indptr, forma):
+        self.dados = np.asarray(dados, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.forma = tuple(forma)
+        self._linhas = None
+
+        if self.indptr.size != self.forma[0] + 1 or self.indices.size != self.dados.size:
+            raise ValueError("Arrays CSR inconsistentes com a forma da matriz.")
+
+    @classmethod
+    def de_densa(cls, A):
+        A = np.asarray(A, dtype=float)
+        linhas, colunas = np.nonzero(A)
+        return cls.de_coordenadas(linhas, colunas, A[linhas, colunas], A.shape)
+
+    @classmethod
+    def de_coordenadas(cls, linhas, colunas, valores, forma):
+        """Monta a matriz a partir de triplas (linha, coluna, valor); repetições são somadas."""
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        n_linhas, n_colunas = forma
+
+        chaves, posicao = np.unique(linhas * n_colunas + colunas, return_inverse=True)
+        dados = np.bincount(posicao, weights=valores, minlength=chaves.size)
+        linhas, indices = np.divmod(chaves, n_colunas)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(linhas, minlength=n_linhas))))
+        return cls(dados, indices, indptr, forma)
+
+    @property
+    def nnz(self):
+        return self.dados.size
+
+    @property
+    def linhas(self):
+        """Linha de cada valor guardado (calculada uma vez, usada no produto matriz-vetor)."""
+        if self._linhas is None:
+            self._linhas = np.repeat(np.arange(self.forma[0]), np.diff(self.indptr))
+        return self._linhas
+
+    def matvec(self, x):
+        """Produto A @ x em O(nnz)."""
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.linhas, weights=self.dados * x[self.indices], minlength=self.forma[0])
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def diagonal(self):
+        d = np.zeros(min(self.forma))
+        na_diagonal = self.linhas == self.indices
+        d[self.indices[na_diagonal]] = self.dados[na_diagonal]
+        return d
+
+    def para_densa(self):
+        A = np.zeros(self.forma)
+        A[self.linhas, self.indices] = self.dados
+        return A
+
+
+def _como_csr(A):
+    if isinstance(A, MatrizCSR):
+        if A.forma[0] != A.forma[1]:
+            raise ValueError("A matriz A deve ser quadrada (n x n).")
+        return A
+    A, _ = validar_matriz_quadrada(A)
+    return MatrizCSR.de_densa(A)
+
+
+def _preparar_sistema(A_input, b_input, x0):
+    A = _como_csr(A_input)
+    n = A.forma[0]
+    b = np.array(b_input, dtype=float)
+    if b.ndim != 1 or b.size != n:
+        raise ValueError("O vetor b deve ter n elementos.")
+
+    diagonal = A.diagonal()
+    if np.any(diagonal == 0):
+        raise ValueError("Há elementos nulos na diagonal de A. Reordene as equações.")
+
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    return A, b, x, diagonal
+
+
+def _residuo_relativo(A, b, x, norma_b):
+    return np.linalg.norm(b - A.matvec(x)) / norma_b
+
+
+def _iterar(A_input, b_input, tol, max_iter, x0, passo):
+    """Laço comum: aplica 'passo' até ||b - Ax|| / ||b|| < tol."""
+    inicio = time.perf_counter()
+    A, b, x, diagonal = _preparar_sistema(A_input, b_input, x0)
+    norma_b = np.linalg.norm(b) or 1.0
+
+    residuo = _residuo_relativo(A, b, x, norma_b)
+    iteracao_cont = 0
+    while residuo >= tol and iteracao_cont < max_iter:
+        iteracao_cont += 1
+        x = passo(A, b, x, diagonal)
+        residuo = _residuo_relativo(A, b, x, norma_b)
+
+    relatorio = {
+        'iteracoes': iteracao_cont,
+        'residuo': float(residuo),
+        'convergiu': bool(residuo < tol),
+        'tempo': time.perf_counter() - inicio,
+    }
+    return x, relatorio
+
+
+def _varredura_sor(A, b, x, diagonal, omega):
+    """Uma varredura de Gauss-Seidel (omega = 1) ou SOR, linha a linha, usando os valores já atualizados."""
+    dados, indices, indptr = A.dados, A.indices, A.indptr
+    for i in range(A.forma[0]):
+        ini, fim = indptr[i], indptr[i + 1]
+        soma = np.dot(dados[ini:fim], x[indices[ini:fim]])
+        x[i] += omega * (b[i] - soma) / diagonal[i]
+    return x
+
+
+# ----------------------------------------------------
+# 4.5 MÉTODO DE GAUSS-JACOBI
+# ----------------------------------------------------
+
+def metodo_gauss_jacobi(A_input, b_input, tol, max_iter=500, x0=None):
+    """Gauss-Jacobi: x_novo = x + D⁻¹ (b - A x), vetorizado sobre todas as linhas.
+
+    A pode ser densa ou MatrizCSR. Retorna (x, relatorio) com 'iteracoes', 'residuo'
+    (||b - Ax|| / ||b||), 'convergiu' e 'tempo' (segundos).
+    """
+    def passo(A, b, x, diagonal):
+        return x + (b - A.matvec(x)) / diagonal
+
+    return _iterar(A_input, b_input, tol, max_iter, x0, passo)
+
+
+# ----------------------------------------------------
+# 4.6 MÉTODO DE GAUSS-SEIDEL
+# ----------------------------------------------------
+
+def metodo_gauss_seidel(A_input, b_input, tol, max_iter=500, x0=None):
+    """Gauss-Seidel: como Jacobi, mas cada x_i novo já é usado nas linhas seguintes.
+
+    Mesmo retorno de metodo_gauss_jacobi.
+    """
+    def passo(A, b, x, diagonal):
+        return _varredura_sor(A, b, x, diagonal, 1.0)
+
+    return _iterar(A_input, b_input, tol, max_iter, x0, passo)
+
+
+# ----------------------------------------------------
+# 4.7 MÉTODO SOR (Sobre-relaxação Sucessiva)
+# ----------------------------------------------------
+
+def metodo_sor(A_input, b_input, tol, omega=1.5, max_iter=500, x0=None):
+    """SOR: Gauss-Seidel com o passo multiplicado por omega (0 < omega < 2).
+
+    Mesmo retorno de metodo_gauss_jacobi.
+    """
+    if not 0 < omega < 2:
+        raise ValueError("O fator de relaxação omega deve estar entre 0 e 2.")
+
+    def passo(A, b, x, diagonal):
+        return _varredura_sor(A, b, x, diagonal, omega)
+
+    return _iterar(A_input, b_input, tol, max_iter, x0, passo)
@@ -0,0 +1,191 @@
+import time
+import numpy as np
+from metodos.utils import validar_matriz_quadrada
+from metodos.lineares_iterativos import MatrizCSR
+
+
+# ----------------------------------------------------
+# 4.8 OPERADOR LINEAR (Matriz densa, esparsa ou apenas a função x -> A x)
+# ----------------------------------------------------
+
+def _operador(A, diagonal):
+    """Retorna (matvec, diagonal) para A densa, MatrizCSR ou uma função matvec(x).
+
+    Quando A é só uma função, a diagonal (para o precondicionador de Jacobi) deve ser informada.
+    """
+    if isinstance(A, MatrizCSR):
+        return A.matvec, (A.diagonal() if diagonal is None else diagonal)
+    if callable(A):
+        return A, diagonal
+    A, _ = validar_matriz_quadrada(A)
+    return (lambda x: A @ x), (np.diag(A) if diagonal is None else diagonal)
+
+
+def _precondicionador(tipo, diagonal, n):
+    """Aplica M⁻¹: identidade (tipo=None) ou Jacobi (M = diag(A))."""
+    if tipo is None:
+        return lambda r: r
+    if tipo != "jacobi":
+        raise ValueError("Precondicionador inválido. Use None ou 'jacobi'.")
+    if diagonal is None:
+        raise ValueError("Para usar o precondicionador de Jacobi com uma função matvec, informe a diagonal de A.")
+
+    diagonal = np.asarray(diagonal, dtype=float)
+    if diagonal.size != n or np.any(diagonal == 0):
+        raise ValueError("A diagonal deve ter n elementos não nulos.")
+    inversa = 1.0 / diagonal
+    return lambda r: inversa * r
+
+
+def _preparar(A, b_input, x0, diagonal, precondicionador):
+    b = np.array(b_input, dtype=float)
+    if b.ndim != 1:
+        raise ValueError("O vetor b deve ser unidimensional.")
+    n = b.size
+
+    matvec, diagonal = _operador(A, diagonal)
+    aplicar_M = _precondicionador(precondicionador, diagonal, n)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    return matvec, aplicar_M, b, x, n
+
+
+# ----------------------------------------------------
+# 4.9 GRADIENTE CONJUGADO (Sistemas simétricos positivos definidos)
+# ----------------------------------------------------
+
+def metodo_gradiente_conjugado(A, b_input, tol=1e-8, max_iter=None, x0=None,
+                               precondicionador=None, diagonal=None, callback=None):
+    """Gradiente Conjugado (precondicionado) para A simétrica positiva definida.
+
+    A pode ser densa, MatrizCSR ou uma função matvec(x) que retorna A @ x (sem montar A).
+    callback(iteracao, residuo) recebe o resíduo relativo de cada iteração (nada é acumulado).
+    Retorna (x, relatorio) com 'iteracoes', 'residuo', 'convergiu' e 'tempo'.
+    """
+    inicio = time.perf_counter()
+    matvec, aplicar_M, b, x, n = _preparar(A, b_input, x0, diagonal, precondicionador)
+    if max_iter is None:
+        max_iter = 10 * n
+    norma_b = np.linalg.norm(b) or 1.0
+
+    r = b - matvec(x)
+    z = aplicar_M(r)
+    p = z.copy()
+    rz = np.dot(r, z)
+    residuo = np.linalg.norm(r) / norma_b
+
+    iteracao_cont = 0
+    while residuo >= tol and iteracao_cont < max_iter:
+        iteracao_cont += 1
+
+        Ap = matvec(p)
+        pAp = np.dot(p, Ap)
+        if pAp <= 0:
+            raise ValueError("A matriz não é simétrica positiva definida (p·Ap <= 0).")
+
+        alfa = rz / pAp
+        x += alfa * p
+        r -= alfa * Ap
+        residuo = np.linalg.norm(r) / norma_b
+
+        if callback is not None:
+            callback(iteracao_cont, residuo)
+        if residuo < tol:
+            break
+
+        z = aplicar_M(r)
+        rz_novo = np.dot(r, z)
+        p = z + (rz_novo / rz) * p
+        rz = rz_novo
+
+    relatorio = {
+        'iteracoes': iteracao_cont,
+        'residuo': float(residuo),
+        'convergiu': bool(residuo < tol),
+        'tempo': time.perf_counter() - inicio,
+    }
+    return x, relatorio
+
+
+# ----------------------------------------------------
+# 4.10 GMRES COM REINÍCIO (Sistemas não simétricos)
+# ----------------------------------------------------
+
+def metodo_gmres(A, b_input, tol=1e-8, reinicio=30, max_iter=None, x0=None,
+                 precondicionador=None, diagonal=None, callback=None):
+    """GMRES(m): minimiza ||b - Ax|| em um subespaço de Krylov de dimensão 'reinicio',
+    reiniciando a partir da última aproximação (a memória fica limitada a reinicio + 1 vetores).
+
+    O precondicionador é aplicado à direita, então o resíduo informado é o verdadeiro.
+    Mesmas entradas e retorno de metodo_gradiente_conjugado.
+    """
+    inicio = time.perf_counter()
+    matvec, aplicar_M, b, x, n = _preparar(A, b_input, x0, diagonal, precondicionador)
+    if max_iter is None:
+        max_iter = 10 * n
+    m = max(1, min(int(reinicio), n))
+    norma_b = np.linalg.norm(b) or 1.0
+
+    r = b - matvec(x)
+    beta = np.linalg.norm(r)
+    residuo = beta / norma_b
+    iteracao_cont = 0
+
+    while residuo >= tol and iteracao_cont < max_iter:
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs = np.zeros(m)
+        sn = np.zeros(m)
+        g = np.zeros(m + 1)
+        V[0] = r / beta
+        g[0] = beta
+
+        k = 0
+        for j in range(m):
+            iteracao_cont += 1
+            k = j + 1
+
+            # Arnoldi (Gram-Schmidt modificado)
+            w = matvec(aplicar_M(V[j]))
+            for i in range(j + 1):
+                H[i, j] = np.dot(w, V[i])
+                w -= H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            ruptura = H[j + 1, j] == 0
+            if not ruptura:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Rotações de Givens: mantêm H triangular superior
+            for i in range(j):
+                h_i = cs[i] * H[i, j] + sn[i] * H[i + 1, j]
+                H[i + 1, j] = -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+                H[i, j] = h_i
+            raio = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / raio, H[j + 1, j] / raio
+            H[j, j] = raio
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+
+            residuo = abs(g[j + 1]) / norma_b
+            if callback is not None:
+                callback(iteracao_cont, residuo)
+            if residuo < tol or ruptura or iteracao_cont >= max_iter:
+                break
+
+        # Combina a base de Krylov com os coeficientes do problema de mínimos quadrados
+        y = np.linalg.solve(np.triu(H[:k, :k]), g[:k])
+        x += aplicar_M(V[:k].T @ y)
+
+        r = b - matvec(x)
+        beta = np.linalg.norm(r)
+        residuo = beta / norma_b
+        if beta == 0:
+            break
+
+    relatorio = {
+        'iteracoes': iteracao_cont,
+        'residuo': float(residuo),
+        'convergiu': bool(residuo < tol),
+        'tempo': time.perf_counter() - inicio,
+    }
+    return x, relatorio
@@ -0,0 +1,100 @@
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+from metodos.utils import criar_funcao, avaliar_vetorizado
+
+
+# =========================================================================
+# EXECUÇÃO EM PARALELO (Integração e varredura de raízes)
+# =========================================================================
+
+# 'processos': ProcessPoolExecutor (f cara em Python puro; f deve ser serializável)
+# 'threads': ThreadPoolExecutor (f que libera o GIL: NumPy, E/S, chamadas externas)
+EXECUTORES = ("processos", "threads")
+
+# Com executor e sem tamanho_bloco, o trabalho é dividido em (até) este número de blocos.
+# O número é fixo (não depende de quantos workers existem), então o resultado também é.
+BLOCOS_PARALELOS = 64
+
+
+def resolver_funcao(f):
+    """Aceita f como função ou como string (ex: "np.cos(x) - x").
+
+    Com executor='processos', as funções criadas por criar_funcao (lambdas) não podem ser
+    enviadas aos processos; passar a string faz cada processo compilá-la (e guardá-la no
+    próprio cache de funções).
+    """
+    if isinstance(f, str):
+        f_num = criar_funcao(f)
+        if f_num is None:
+            raise ValueError("A função digitada é inválida. Use 'np.' para funções trigonométricas/exponenciais.")
+        return f_num
+    return f
+
+
+@contextmanager
+def abrir_executor(executor=None, max_workers=None):
+    """Entrega o Executor a ser usado (ou None para execução serial).
+
+    executor pode ser None, 'processos', 'threads' ou uma instância de concurrent.futures.Executor.
+    Os pools criados aqui são encerrados na saída; uma instância recebida não é encerrada.
+    """
+    if executor is None or isinstance(executor, Executor):
+        yield executor
+        return
+    if executor not in EXECUTORES:
+        raise ValueError(f"Executor inválido: '{executor}'. Use um de {EXECUTORES} ou um Executor.")
+
+    classe = ProcessPoolExecutor if executor == "processos" else ThreadPoolExecutor
+    with classe(max_workers=max_workers) as pool:
+        yield pool
+
+
+def definir_tamanho_bloco(tamanho_bloco, total, executor, padrao=None):
+    """Tamanho de bloco efetivo para dividir `total` itens.
+
+    Um tamanho_bloco informado é sempre respeitado. Sem ele, a execução serial usa `padrao`
+    (None: um só bloco) e a paralela divide o total em BLOCOS_PARALELOS blocos (limitados a
+    `padrao`), para que mesmo um n modesto gere trabalho para todos os workers.
+    """
+    if tamanho_bloco is not None:
+        return max(int(tamanho_bloco), 1)
+    if executor is None:
+        return padrao
+    bloco = max(-(-int(total) // BLOCOS_PARALELOS), 1)
+    return bloco if padrao is None else min(bloco, padrao)
+
+
+def mapear_em_ordem(funcao, tarefas, executor=None):
+    """Aplica funcao(*tarefa) a cada tarefa e retorna os resultados na ORDEM das tarefas.
+
+    A divisão em tarefas não depende do número de workers, e quem chama reduz os resultados
+    nessa ordem fixa: a resposta é a mesma em execução serial ou com qualquer número de workers.
+    """
+    tarefas = list(tarefas)
+    if executor is not None and len(tarefas) <= 1:
+        warnings.warn("Executor informado, mas o trabalho coube em um único bloco: execução serial. "
+                      "Reduza tamanho_bloco para distribuí-lo entre os workers.", RuntimeWarning, stacklevel=3)
+    if executor is None or len(tarefas) <= 1:
+        return [funcao(*tarefa) for tarefa in tarefas]
+    return list(executor.map(funcao, *zip(*tarefas)))
+
+
+def _avaliar_bloco(f, x):
+    return avaliar_vetorizado(resolver_funcao(f), x)
+
+
+def avaliar_em_blocos(f, x, tamanho_bloco=None, executor=None):
+    """Avalia f no array x, dividido em blocos de até `tamanho_bloco` pontos.
+
+    Sem tamanho_bloco: um só bloco em execução serial, ou BLOCOS_PARALELOS blocos com executor.
+    """
+    x = np.asarray(x, dtype=float)
+    tamanho_bloco = definir_tamanho_bloco(tamanho_bloco, x.size, executor)
+    if tamanho_bloco is None or x.size <= tamanho_bloco:
+        return _avaliar_bloco(f, x)
+
+    tarefas = [(f, x[ini:ini + tamanho_bloco]) for ini in range(0, x.size, tamanho_bloco)]
+    return np.concatenate(mapear_em_ordem(_avaliar_bloco, tarefas, executor))
@@ -1,14 +1,19 @@
 import math
+import threading
+from collections import OrderedDict
+
 import numpy as np
 import sympy
 
 
 # =========================================================================
-# FUNÇÕES GERAIS E CONVERSÃO
+# CACHE DE FUNÇÕES COMPILADAS (LRU)
 # =========================================================================
 
-def criar_funcao(func_str):
-    """Cria e retorna a função lambda (para cálculo numérico) a partir de uma string."""
+_NAO_CALCULADO = object()
+
+
+def _compilar_lambda(func_str):
     ambiente = {"math": math, "np": np}
     try:
         # Permite que o usuário use np.sin, np.exp, etc.
@@ -17,24 +22,234 @@ def criar_funcao(func_str):
         return None
 
 
+class FuncaoCompilada:
+    """Função do usuário compilada uma única vez.
+
+    Guarda a lambda numérica; a expressão sympy e as derivadas (simbólicas e
+    lambdificadas) só são calculadas quando pedidas e ficam guardadas.
+    """
+
+    def __init__(self, func_str):
+        self.func_str = func_str
+        self.simbolo = sympy.Symbol('x')
+        self.numerica = _compilar_lambda(func_str)
+        self._expressao = _NAO_CALCULADO
+        self._derivadas = {}
+        self._lambdificadas = {}
+
+    @property
+    def expressao(self):
+        """Expressão sympy de f(x), ou None se a string não for válida para o sympy."""
+        if self._expressao is _NAO_CALCULADO:
+            try:
+                self._expressao = sympy.sympify(self.func_str)
+            except Exception:
+                self._expressao = None
+        return self._expressao
+
+    def derivada(self, ordem=1):
+        """Derivada simbólica de ordem 'ordem' (ordem=0 retorna a própria expressão)."""
+        if self.expressao is None:
+            return None
+        if ordem == 0:
+            return self.expressao
+        if ordem not in self._derivadas:
+            self._derivadas[ordem] = sympy.diff(self.derivada(ordem - 1), self.simbolo)
+        return self._derivadas[ordem]
+
+    def lambdificada(self, ordem=0):
+        """Versão numpy (sympy.lambdify) da derivada de ordem 'ordem'."""
+        if ordem not in self._lambdificadas:
+            expr = self.derivada(ordem)
+            if expr is None:
+                return None
+            self._lambdificadas[ordem] = sympy.lambdify(self.simbolo, expr, 'numpy')
+        return self._lambdificadas[ordem]
+
+
+class CacheFuncoes:
+    """Cache LRU de FuncaoCompilada, indexado pela string da expressão normalizada."""
+
+    def __init__(self, tamanho_maximo=128):
+        self.tamanho_maximo = int(tamanho_maximo)
+        self._entradas = OrderedDict()
+        self._trava = threading.Lock()  # O Streamlit executa cada sessão em uma thread
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    @staticmethod
+    def normalizar(func_str):
+        return " ".join(str(func_str).split())
+
+    def obter(self, func_str):
+        chave = self.normalizar(func_str)
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is not None:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+                return entrada
+            self.falhas += 1
+
+        # A compilação fica fora da trava (o sympy pode ser lento)
+        entrada = FuncaoCompilada(chave)
+        with self._trava:
+            if self.tamanho_maximo > 0:
+                self._entradas[chave] = entrada
+                self._entradas.move_to_end(chave)
+                self._remover_excedentes()
+        return entrada
+
+    def _remover_excedentes(self):
+        while len(self._entradas) > self.tamanho_maximo:
+            self._entradas.popitem(last=False)
+            self.remocoes += 1
+
+    def redimensionar(self, tamanho_maximo):
+        with self._trava:
+            self.tamanho_maximo = int(tamanho_maximo)
+            self._remover_excedentes()
+
+    def limpar(self):
+        with self._trava:
+            self._entradas.clear()
+            self.acertos = self.falhas = self.remocoes = 0
+
+    def estatisticas(self):
+        with self._trava:
+            return {
+                'tamanho': len(self._entradas),
+                'tamanho_maximo': self.tamanho_maximo,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'remocoes': self.remocoes,
+            }
+
+
+_CACHE_FUNCOES = CacheFuncoes()
+
+
+def obter_funcao_compilada(func_str):
+    """Retorna a FuncaoCompilada de func_str, compilando-a apenas na primeira vez."""
+    return _CACHE_FUNCOES.obter(func_str)
+
+
+def configurar_cache_funcoes(tamanho_maximo):
+    """Altera o número máximo de funções guardadas (0 desativa o cache)."""
+    _CACHE_FUNCOES.redimensionar(tamanho_maximo)
+
+
+def estatisticas_cache_funcoes():
+    """Acertos, falhas, remoções e ocupação do cache de funções."""
+    return _CACHE_FUNCOES.estatisticas()
+
+
+def limpar_cache_funcoes():
+    _CACHE_FUNCOES.limpar()
+
+
+# =========================================================================
+# FUNÇÕES GERAIS E CONVERSÃO
+# =========================================================================
+
+def criar_funcao(func_str):
+    """Cria e retorna a função lambda (para cálculo numérico) a partir de uma string."""
+    return obter_funcao_compilada(func_str).numerica
+
+
+def avaliar_vetorizado(f, x):
+    """Avalia f em todo o array x de uma só vez, retornando um array float do mesmo formato.
+
+    Se f não aceitar arrays (ex: usa math.cos), recai na avaliação ponto a ponto.
+    """
+    x = np.asarray(x, dtype=float)
+    try:
+        fx = np.asarray(f(x), dtype=float)
+        if fx.shape == x.shape:
+            return fx
+        if fx.ndim == 0:
+            # Funções constantes (ex: "2") retornam um escalar
+            return np.full(x.shape, float(fx))
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(x_i) for x_i in x.ravel()], dtype=float).reshape(x.shape)
+
+
 def criar_funcao_simbolica(func_str):
     """Cria e retorna a expressão simbólica (para cálculo da derivada) e a variável 'x'."""
-    x = sympy.Symbol('x')
-    try:
-        expr = sympy.sympify(func_str)
-        return expr, x
-    except Exception:
+    funcao = obter_funcao_compilada(func_str)
+    if funcao.expressao is None:
         return None, None
+    return funcao.expressao, funcao.simbolo
+
+
+# =========================================================================
+# REGISTRO DAS ITERAÇÕES (Tabelas exibidas no Streamlit)
+# =========================================================================
+
+# 'nenhum': não registra nada | 'array': array estruturado com os floats brutos
+# 'tabela': lista de dicts com strings formatadas (formato original, pronto para o DataFrame)
+RASTREIO_MODOS = ("nenhum", "array", "tabela")
+
+
+class Rastreio:
+    """Registra as iterações de um método em um array estruturado pré-alocado."""
+
+    def __init__(self, modo, campos, max_iter):
+        if modo not in RASTREIO_MODOS:
+            raise ValueError(f"Modo de rastreio inválido: {modo}. Use um de {RASTREIO_MODOS}.")
+
+        self.modo = modo
+        self.n = 0
+        self.dados = None
+        if modo != "nenhum":
+            dtype = [('Iteração', int)] + [(campo, float) for campo in campos]
+            self.dados = np.empty(max(int(max_iter), 1), dtype=dtype)
+
+    def registrar(self, iteracao, *valores):
+        if self.dados is None:
+            return
+        if self.n == self.dados.size:
+            self.dados = np.resize(self.dados, 2 * self.dados.size)
+        self.dados[self.n] = (iteracao, *valores)
+        self.n += 1
+
+    def resultado(self):
+        """None (modo 'nenhum'), o array estruturado ('array') ou a tabela formatada ('tabela')."""
+        if self.dados is None:
+            return None
+        dados = self.dados[:self.n]
+        return formatar_iteracoes(dados) if self.modo == "tabela" else dados
+
+
+def formatar_iteracoes(iteracoes):
+    """Converte o registro das iterações na tabela formatada (lista de dicts) exibida no Streamlit."""
+    if iteracoes is None:
+        return []
+    if isinstance(iteracoes, list):
+        return iteracoes  # Já está formatada
+
+    campos = iteracoes.dtype.names
+    return [
+        {campo: int(linha[campo]) if campo == 'Iteração' else f"{linha[campo]:.6f}" for campo in campos}
+        for linha in iteracoes
+    ]
+
+
+def validar_matriz_quadrada(A):
+    """Converte A para array float e verifica se é quadrada (n x n)."""
+    A = np.array(A, dtype=float)
+    if A.ndim != 2 or A.shape[1] != A.shape[0]:
+        raise ValueError("A matriz A deve ser quadrada (n x n).")
+    return A, A.shape[0]
 
 
 def validar_sistema_linear(A, b):
     """Valida se o sistema A (matriz) e b (vetor) têm dimensões compatíveis."""
-    A = np.array(A, dtype=float)
+    A, n = validar_matriz_quadrada(A)
     b = np.array(b, dtype=float)
-    n = A.shape[0]
 
-    if A.shape[1] != n:
-        raise ValueError("A matriz A deve ser quadrada (n x n).")
     if b.ndim != 1 or b.size != n:
         raise ValueError("O vetor b deve ter n elementos.")
 